@@ -0,0 +1,43 @@
+"""
+Precomputes connectivity of start and end vertices in every time step of a processed dataset,
+and stores it in connectivity.pkl next to dataset.pkl. The experiments then validate empty answers without a search.
+"""
+
+import argparse
+import os
+import pickle
+import sys
+import time
+
+sys.path.append("../..")
+
+from models.offline_connectivity import edge_lifetimes, offline_connectivity
+
+def parse_args():
+    parser = argparse.ArgumentParser(description = 'Precompute connectivity of start and end vertices over the timeline of a dataset.')
+    parser.add_argument('--dataset', dest = 'dataset', type = str, required = True, help = "Dataset ('contact' or 'wikipedia')")
+    return parser.parse_args()
+
+args = parse_args()
+if args.dataset not in ["contact", "wikipedia"]:
+    print("Wrong name of the dataset! Use 'contact' or 'wikipedia'.")
+    sys.exit(1)
+
+with open(os.path.join("..", args.dataset, "dataset.pkl"), "rb") as fin:
+    dataset = pickle.load(fin)
+
+time_start = time.time()
+time_steps = len(dataset["edges"])
+lifetimes = edge_lifetimes(dataset)
+n = max([max(lifetime[0], lifetime[1]) for lifetime in lifetimes] + [dataset["start_vertex"], dataset["end_vertex"]]) + 1
+connected = offline_connectivity(n, time_steps, lifetimes, dataset["start_vertex"], dataset["end_vertex"])
+print("Number of time steps: {}, edge lifetimes: {}".format(time_steps, len(lifetimes)))
+print("Connected in {} of {} time steps ({} s)".format(sum(connected), time_steps, round(time.time() - time_start, 2)))
+
+connectivity = dict()
+connectivity["start_vertex"] = dataset["start_vertex"]
+connectivity["end_vertex"] = dataset["end_vertex"]
+connectivity["connected"] = connected
+
+with open(os.path.join("..", args.dataset, "connectivity.pkl"), 'wb') as handle:
+    pickle.dump(connectivity, handle, protocol = pickle.HIGHEST_PROTOCOL)
@@ -6,6 +6,7 @@ from tqdm import tqdm
 
 sys.path.append("../..")
 
+from models.ground_truth import cached_ground_truth
 from models.unweighted_model import UnweightedGraph
 from algorithms.one_path import AlgorithmOnePath
 from algorithms.two_path import AlgorithmTwoPath
@@ -20,6 +21,7 @@ ITERATIONS = 10_000
 EXPERIMENT_COUNT = 100
 
 RESULTS_PATH = os.path.join("..", "results", "bound_constant.pkl")
+GROUND_TRUTH_PATH = os.path.join("..", "ground_truth")
 
 for n in N:
     M[0].append(int(n * math.log(n)) + 1)
@@ -46,9 +48,13 @@ with tqdm(total = len(C0) * len(M) * len(N) * EXPERIMENT_COUNT) as pbar:
                 results[c0][m_id][N[i]]["two_path"] = 0.0
                 for experiment in range(EXPERIMENT_COUNT):
                     algorithms = [AlgorithmOnePath(c0, N[i]), AlgorithmTwoPath(c0, N[i])]
+                    # every algorithm runs on its own fork of the same generated graph
+                    initial_graph = UnweightedGraph(experiment, N[i], M[m_id][i])
+                    # connectivity of every iteration is shared by all values of c0
+                    ground_truth = cached_ground_truth(GROUND_TRUTH_PATH, initial_graph, "basic", experiment, CHANGE_RATE, ITERATIONS)
                     for algorithm in algorithms:
-                        graph = UnweightedGraph(experiment, N[i], M[m_id][i])
-                        runner = Runner(PROBE_RATE, CHANGE_RATE, algorithm, graph)
+                        graph = initial_graph.fork()
+                        runner = Runner(PROBE_RATE, CHANGE_RATE, algorithm, graph, ground_truth = ground_truth)
                         runner.run(ITERATIONS, -1)
                         print("c0 = {}, m={}, n={}, alg={}, ans={}".format(c0, M[m_id][i], N[i], algorithm.name, runner.get_correct_answers()))
                         results[c0][m_id][N[i]][algorithm.name] += runner.get_correct_answers_after_1st_phase() / EXPERIMENT_COUNT
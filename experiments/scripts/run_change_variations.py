@@ -6,6 +6,7 @@ from tqdm import tqdm
 
 sys.path.append("../..")
 
+from models.ground_truth import cached_ground_truth
 from models.unweighted_model import UnweightedGraph
 from models.unweighted_model_e import UnweightedGraphE
 from models.unweighted_model_v import UnweightedGraphV
@@ -25,6 +26,7 @@ ITERATIONS = 10_000
 EXPERIMENT_COUNT = 100
 
 RESULTS_PATH = os.path.join("..", "results", "change_variations.pkl")
+GROUND_TRUTH_PATH = os.path.join("..", "ground_truth")
 
 for n in N:
     M[0].append(int(n * math.log(n)) + 1)
@@ -68,7 +70,9 @@ with tqdm(total = len(M) * len(N) * len(ALGORITHMS) * len(MODELS) * EXPERIMENT_C
                             graph = UnweightedGraphV(experiment, N[i], M[m_id][i])
                         elif model_desc == "ev":
                             graph = UnweightedGraphEV(experiment, N[i], M[m_id][i])
-                        runner = Runner(PROBE_RATE, CHANGE_RATE, algorithm, graph)
+                        # connectivity of every iteration is computed by the first algorithm and loaded by the second
+                        ground_truth = cached_ground_truth(GROUND_TRUTH_PATH, graph, model_desc, experiment, CHANGE_RATE, ITERATIONS)
+                        runner = Runner(PROBE_RATE, CHANGE_RATE, algorithm, graph, ground_truth = ground_truth)
                         runner.run(ITERATIONS, -1)
                         print("m={}, n={}, alg={}, model={}, ans={}".format(M[m_id][i], N[i], algorithm.name, model_desc, runner.get_correct_answers()))
                         results[C0][m_id][N[i]][algorithm.name][model_desc] += runner.get_correct_answers_after_1st_phase() / EXPERIMENT_COUNT
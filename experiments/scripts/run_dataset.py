@@ -7,6 +7,8 @@ from tqdm import tqdm
 
 sys.path.append("../..")
 
+from models.ground_truth import dataset_ground_truth
+from models.offline_connectivity import load_connectivity
 from models.unweighted_model import UnweightedGraph
 from algorithms.one_path import AlgorithmOnePath
 from algorithms.two_path import AlgorithmTwoPath
@@ -26,6 +28,7 @@ if args.dataset not in ["contact", "wikipedia"]:
     print("Wrong name of the dataset! Use 'contact' or 'wikipedia'.")
 
 DATASET_PATH = os.path.join("..", "..", "datasets", args.dataset, "dataset.pkl")
+CONNECTIVITY_PATH = os.path.join("..", "..", "datasets", args.dataset, "connectivity.pkl")
 RESULTS_PATH = os.path.join("..", "results", "results_" + args.dataset + ".pkl")
 
 if "contact" in args.dataset:
@@ -41,6 +44,12 @@ if "wikipedia" in args.dataset:
     print("Dataset loaded.")
     iterations = len(dataset["edges"])
 
+ground_truth = None
+if load_connectivity(dataset, CONNECTIVITY_PATH):
+    ground_truth = dataset_ground_truth(dataset)
+else:
+    print("Precomputed connectivity not found, empty answers are validated by search (see datasets/scripts/process_connectivity.py).")
+
 if os.path.exists(RESULTS_PATH):
     with open(RESULTS_PATH, "rb") as fin:
         results = pickle.load(fin)
@@ -63,7 +72,7 @@ with tqdm(total = len(C0) * len(PROBE_RATE)) as pbar:
                         results[c0][probe_rate][algorithm.name][metric] = 0
             for algorithm in algorithms:
                 graph = UnweightedGraph(0, n, 0, False)
-                runner = Runner(probe_rate, CHANGE_RATE, algorithm, graph, True, dataset)
+                runner = Runner(probe_rate, CHANGE_RATE, algorithm, graph, True, dataset, ground_truth)
                 runner.run(iterations, -1)
                 print("c0 = {}, alg={}, ans={}".format(c0, algorithm.name, runner.get_correct_answers()))
                 results[c0][probe_rate][algorithm.name]["correct"] = runner.get_correct_answers()     # Different from random graphs
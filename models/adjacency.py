@@ -0,0 +1,367 @@
+"""
+Adjacency storage backends for the unweighted evolving graph models.
+
+The default storage is a list of Python sets (one set per vertex).
+The compact storage keeps the same interface (adjacency_list[v] supports `in`, iteration, len, add and remove),
+but stores neighbors in a flat integer array with per-vertex slack (about 6 bytes per direction of an edge, compared to
+about 60 bytes of a set entry with its integer object).
+The bitset storage keeps the same interface with an n x n bit matrix (n^2 / 8 bytes), which is used for small graphs
+by the opt-in "auto" storage, and finds connected vertices with whole-frontier searches over matrix rows.
+Its changes are slower than those of sets, and its neighbors are iterated in a different order (which changes the answers
+of the algorithms), so sets remain the default storage.
+"""
+
+from array import array
+from collections.abc import Set
+from struct import Struct
+
+import numpy as np
+
+STORAGE_TYPES = ["auto", "set", "compact", "bitset"]
+
+# "auto" storage uses the bitset storage for graphs with at most this many vertices, and sets otherwise
+BITSET_MAX_N = 4096
+
+_MIN_CAPACITY = 4
+# native int of array('i'), whose bytes are searched for in the neighbors of CompactAdjacency
+_INT = Struct('i')
+# number of set bits of every byte value
+_POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype = np.int64)
+
+
+def resolve_storage(n, storage):
+    """ Returns the storage type used for n vertices, which resolves "auto" storage by the size threshold. """
+    if storage == "auto":
+        return "bitset" if n <= BITSET_MAX_N else "set"
+    if storage not in STORAGE_TYPES:
+        raise ValueError("Unknown storage type '{}', use one of: {}".format(storage, ", ".join(STORAGE_TYPES)))
+    return storage
+
+
+def create_adjacency(n, storage = "set", expected_degree = 0):
+    """ Creates an empty adjacency storage for n vertices. """
+    storage = resolve_storage(n, storage)
+    if storage == "compact":
+        return CompactAdjacency(n, expected_degree)
+    if storage == "bitset":
+        return BitsetAdjacency(n)
+    return [set() for _ in range(n)]
+
+
+def insert_edges(adjacency_list, lo, hi):
+    """ Inserts both directions of the edges (lo[i], hi[i]), given as NumPy arrays, into an adjacency storage. """
+    if isinstance(adjacency_list, (CompactAdjacency, BitsetAdjacency)):
+        adjacency_list.bulk_insert(lo, hi)
+        return
+    src = np.concatenate((lo, hi))
+    dst = np.concatenate((hi, lo))
+    order = np.argsort(src, kind = "stable")
+    src = src[order]
+    dst = dst[order].tolist()
+    vertices, starts = np.unique(src, return_index = True)
+    ends = np.append(starts[1:], len(src))
+    for v, start, end in zip(vertices.tolist(), starts.tolist(), ends.tolist()):
+        adjacency_list[v].update(dst[start : end])
+
+
+def _to_array(typecode, values):
+    result = array(typecode)
+    result.frombytes(values.astype(np.int64 if typecode == 'q' else np.int32).tobytes())
+    return result
+
+
+class CompactAdjacency(object):
+    """
+    Array-backed adjacency storage.
+
+    Neighbors of vertex v are stored in neighbors[offset[v] : offset[v] + degree[v]], the slice has capacity[v] slots.
+    A full slice is moved to the end of the flat array with doubled capacity, and the flat array is compacted once
+    more than half of it is unused.
+
+    There is no index of edges: membership tests and removals search the bytes of the slice of the vertex (a C byte
+    search, without creating integer objects), which is fast for the degrees of the interesting range of parameters (O(sqrt(n)) at most).
+    Like the list of sets, both directions of an edge are inserted and removed separately.
+    """
+
+    def __init__(self, n, expected_degree = 0):
+        self.n = n
+        capacity = max(_MIN_CAPACITY, expected_degree)
+        self._offset = array('q', range(0, n * capacity, capacity))
+        self._degree = array('i', bytes(4 * n))
+        self._capacity = array('i', [capacity]) * n
+        self._neighbors = array('i', bytes(4 * n * capacity))
+        self._garbage = 0
+
+    def _grow(self, v):
+        """ Moves the slice of v to the end of the flat array, doubling its capacity. """
+        offset = self._offset[v]
+        capacity = self._capacity[v]
+        degree = self._degree[v]
+        self._offset[v] = len(self._neighbors)
+        self._neighbors.extend(self._neighbors[offset : offset + degree])
+        self._neighbors.extend(array('i', bytes(4 * (2 * capacity - degree))))
+        self._capacity[v] = 2 * capacity
+        self._garbage += capacity
+        if 2 * self._garbage > len(self._neighbors):
+            self._compact()
+
+    def _compact(self):
+        neighbors = array('i')
+        for v in range(self.n):
+            offset = self._offset[v]
+            self._offset[v] = len(neighbors)
+            neighbors.extend(self._neighbors[offset : offset + self._capacity[v]])
+        self._neighbors = neighbors
+        self._garbage = 0
+
+    def bulk_insert(self, lo, hi):
+        """
+        Inserts both directions of the edges (lo[i], hi[i]) given as NumPy arrays.
+        An empty storage is filled in one pass, with slices laid out from the degree counts.
+        """
+        if len(lo) == 0:
+            return
+        if any(self._degree) or np.any(lo == hi):
+            for v, v2 in zip(lo.tolist(), hi.tolist()):
+                self.add(v, v2)
+                self.add(v2, v)
+            return
+        m = len(lo)
+        src = np.concatenate((lo, hi)).astype(np.int64)
+        dst = np.concatenate((hi, lo))
+        degree = np.bincount(src, minlength = self.n)
+        start = np.concatenate(([0], np.cumsum(degree)[:-1]))
+        order = np.argsort(src, kind = "stable")
+        position = np.empty(2 * m, dtype = np.int64)
+        position[order] = np.arange(2 * m) - start[src[order]]
+        capacity = np.maximum(degree + degree // 2, _MIN_CAPACITY)
+        offset = np.concatenate(([0], np.cumsum(capacity)[:-1]))
+        neighbors = np.zeros(int(capacity.sum()), dtype = np.int32)
+        neighbors[offset[src] + position] = dst
+        self._offset = _to_array('q', offset)
+        self._degree = _to_array('i', degree)
+        self._capacity = _to_array('i', capacity)
+        self._neighbors = _to_array('i', neighbors)
+        self._garbage = 0
+
+    def copy(self):
+        """ Returns an independent copy of the storage, which copies the flat arrays. """
+        storage = CompactAdjacency.__new__(CompactAdjacency)
+        storage.__dict__.update(self.__dict__)
+        for name in ["_offset", "_degree", "_capacity", "_neighbors"]:
+            setattr(storage, name, getattr(self, name)[:])
+        return storage
+
+    def _find(self, v, v2):
+        """ Returns the index of v2 in the slice of v, or -1 if v2 is not a neighbor of v. """
+        offset = self._offset[v]
+        data = self._neighbors[offset : offset + self._degree[v]].tobytes()
+        pattern = _INT.pack(v2)
+        i = data.find(pattern)
+        # skip matches that are not aligned to an array element
+        while i & 3:
+            i = data.find(pattern, i + 1)
+        return i >> 2 if i != -1 else -1
+
+    def contains(self, v, v2):
+        """ Checks whether v2 is a neighbor of v. """
+        return self._find(v, v2) != -1
+
+    def add(self, v, v2):
+        """ Inserts v2 into the neighbors of v. Returns False if v2 was already a neighbor. """
+        if self._find(v, v2) != -1:
+            return False
+        degree = self._degree[v]
+        if degree == self._capacity[v]:
+            self._grow(v)
+        self._neighbors[self._offset[v] + degree] = v2
+        self._degree[v] = degree + 1
+        return True
+
+    def remove(self, v, v2):
+        """ Removes v2 from the neighbors of v, raises KeyError if v2 is not a neighbor (same as set.remove). """
+        position = self._find(v, v2)
+        if position == -1:
+            raise KeyError(v2)
+        offset = self._offset[v]
+        last = self._degree[v] - 1
+        self._neighbors[offset + position] = self._neighbors[offset + last]
+        self._degree[v] = last
+
+    def clear(self, v):
+        """ Removes all neighbors of v (the reverse directions are left untouched). """
+        self._degree[v] = 0
+
+    def degree(self, v):
+        return self._degree[v]
+
+    def neighbors(self, v):
+        """ Returns a copy of the neighbors of v as an integer array. """
+        offset = self._offset[v]
+        return self._neighbors[offset : offset + self._degree[v]]
+
+    def edge_count(self):
+        """ Number of undirected edges, assuming both directions of every edge are present. """
+        return sum(self._degree) // 2
+
+    def nbytes(self):
+        """ Approximate memory used by the storage arrays. """
+        arrays = [self._offset, self._degree, self._capacity, self._neighbors]
+        return sum(a.itemsize * len(a) for a in arrays)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, v):
+        return NeighborView(self, v)
+
+    def __setitem__(self, v, neighbors):
+        self.clear(v)
+        for v2 in neighbors:
+            self.add(v, v2)
+
+    def __iter__(self):
+        for v in range(self.n):
+            yield NeighborView(self, v)
+
+
+class BitsetAdjacency(object):
+    """
+    Bit matrix adjacency storage: bit v2 of row v is set iff v2 is a neighbor of v.
+    Rows of row_bytes bytes are stored in a single bytearray, which is also available as a NumPy matrix of shape (n, row_bytes).
+    Like the list of sets, both directions of an edge are inserted and removed separately.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self._row_bytes = (n + 7) // 8
+        self._bits = bytearray(n * self._row_bytes)
+        self._degree = array('i', bytes(4 * n))
+        self.matrix = np.frombuffer(self._bits, dtype = np.uint8).reshape(n, self._row_bytes)
+
+    def bulk_insert(self, lo, hi):
+        """ Inserts both directions of the edges (lo[i], hi[i]) given as NumPy arrays. """
+        src = np.concatenate((lo, hi)).astype(np.int64)
+        dst = np.concatenate((hi, lo)).astype(np.int64)
+        flat = self.matrix.reshape(-1)
+        np.bitwise_or.at(flat, src * self._row_bytes + (dst >> 3), (1 << (dst & 7)).astype(np.uint8))
+        self._degree = _to_array('i', _POPCOUNT[self.matrix].sum(axis = 1))
+
+    def copy(self):
+        """ Returns an independent copy of the storage. """
+        storage = BitsetAdjacency(0)
+        storage.n = self.n
+        storage._row_bytes = self._row_bytes
+        storage._bits = bytearray(self._bits)
+        storage._degree = self._degree[:]
+        storage.matrix = np.frombuffer(storage._bits, dtype = np.uint8).reshape(self.n, self._row_bytes)
+        return storage
+
+    def contains(self, v, v2):
+        """ Checks whether v2 is a neighbor of v. """
+        return (self._bits[v * self._row_bytes + (v2 >> 3)] >> (v2 & 7)) & 1 == 1
+
+    def add(self, v, v2):
+        """ Inserts v2 into the neighbors of v. Returns False if v2 was already a neighbor. """
+        i = v * self._row_bytes + (v2 >> 3)
+        bit = 1 << (v2 & 7)
+        if self._bits[i] & bit:
+            return False
+        self._bits[i] |= bit
+        self._degree[v] += 1
+        return True
+
+    def remove(self, v, v2):
+        """ Removes v2 from the neighbors of v. Raises KeyError if v2 is not a neighbor. """
+        i = v * self._row_bytes + (v2 >> 3)
+        bit = 1 << (v2 & 7)
+        if not self._bits[i] & bit:
+            raise KeyError(v2)
+        self._bits[i] ^= bit
+        self._degree[v] -= 1
+
+    def clear(self, v):
+        """ Removes all neighbors of v (only the direction from v). """
+        self.matrix[v] = 0
+        self._degree[v] = 0
+
+    def degree(self, v):
+        return self._degree[v]
+
+    def neighbors(self, v):
+        """ Returns a list of the neighbors of v, in increasing order. """
+        return np.flatnonzero(np.unpackbits(self.matrix[v], count = self.n, bitorder = "little")).tolist()
+
+    def connected(self, v, v2):
+        """
+        Checks whether a path from v to v2 exists (v2 != v). The search expands the whole frontier at once:
+        the vertices reached from the frontier are the bitwise OR of the rows of the frontier vertices.
+        """
+        visited = np.zeros(self._row_bytes, dtype = np.uint8)
+        visited[v >> 3] |= 1 << (v & 7)
+        frontier = [v]
+        while len(frontier) > 0:
+            reached = np.bitwise_or.reduce(self.matrix[frontier], axis = 0) & ~visited
+            if (reached[v2 >> 3] >> (v2 & 7)) & 1:
+                return True
+            visited |= reached
+            frontier = np.flatnonzero(np.unpackbits(reached, count = self.n, bitorder = "little"))
+        return False
+
+    def edge_count(self):
+        """ Number of undirected edges, assuming both directions of every edge are present. """
+        return sum(self._degree) // 2
+
+    def nbytes(self):
+        """ Approximate memory used by the storage arrays. """
+        return len(self._bits) + self._degree.itemsize * len(self._degree)
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, v):
+        return NeighborView(self, v)
+
+    def __setitem__(self, v, neighbors):
+        self.clear(v)
+        for v2 in neighbors:
+            self.add(v, v2)
+
+    def __iter__(self):
+        for v in range(self.n):
+            yield NeighborView(self, v)
+
+
+class NeighborView(Set):
+    """ Set-like view of the neighbors of a single vertex of CompactAdjacency or BitsetAdjacency. """
+    __slots__ = ("_storage", "_v")
+
+    def __init__(self, storage, v):
+        self._storage = storage
+        self._v = v
+
+    @classmethod
+    def _from_iterable(cls, iterable):
+        return set(iterable)
+
+    def __contains__(self, v2):
+        return self._storage.contains(self._v, v2)
+
+    def __iter__(self):
+        return iter(self._storage.neighbors(self._v))
+
+    def __len__(self):
+        return self._storage._degree[self._v]
+
+    def add(self, v2):
+        self._storage.add(self._v, v2)
+
+    def remove(self, v2):
+        self._storage.remove(self._v, v2)
+
+    def discard(self, v2):
+        if v2 in self:
+            self._storage.remove(self._v, v2)
+
+    def __repr__(self):
+        return "NeighborView({}: {})".format(self._v, list(self))
@@ -0,0 +1,179 @@
+"""
+Change types of the evolving graph model.
+
+Every change type is a plugin with a weight:
+    - feasible(graph) checks whether the change is allowed in the current state of the graph,
+    - apply(graph) performs the change with the primitive mutations of EvolvingGraph.
+At every change, the model picks one of the feasible change types with probability proportional to its weight.
+All change types retain the interesting range of parameters: (n log n) <= m <= n^(3/2).
+"""
+
+import math
+
+import numpy as np
+
+# models with a single change type use its batched implementation of apply_many for at least this many changes
+BLOCK_CHANGES_THRESHOLD = 16
+
+
+class ChangeType(object):
+    name = ""
+    # whether feasible() or apply() use the degree index of the graph
+    uses_degree_index = False
+
+    def __init__(self, weight = 1):
+        self.weight = weight
+
+    def feasible(self, graph):
+        return True
+
+    def apply(self, graph):
+        raise NotImplementedError
+
+    def apply_many(self, graph, k):
+        """ Performs k changes of this type, only used if it is the only change type of the model. """
+        for _ in range(k):
+            self.apply(graph)
+
+    def __repr__(self):
+        return "{}(weight = {})".format(type(self).__name__, self.weight)
+
+
+class SwapEdge(ChangeType):
+    """ Random edge swap: remove a random edge, and insert an edge between two disconnected vertices. """
+    name = "swap-edge"
+
+    def feasible(self, graph):
+        # an edge to remove, and a non-edge to insert
+        return 0 < graph.m < graph.n * (graph.n - 1) // 2
+
+    def apply(self, graph):
+        v1, v2 = graph.edges.choose_random(graph.random)
+        v3, v4 = graph.choose_non_edge()
+        graph.remove_edge(v1, v2)
+        graph.add_edge(v3, v4)
+
+    def apply_many(self, graph, k):
+        """
+        Performs k edge swaps, with the same distribution as k calls of apply().
+        Random numbers of all swaps are drawn in NumPy blocks, and every removed edge is replaced in place in the edge pool by the inserted edge.
+        """
+        if k < BLOCK_CHANGES_THRESHOLD:
+            super().apply_many(graph, k)
+            return
+        generator = graph.random.generator
+        edges = graph.edges
+        key_at = edges.key_at
+        adjacency_list = graph.adjacency_list
+        vertices = graph.active_vertices.vertices
+        # the numbers of edges and vertices do not change, so positions of the removed edges can be drawn in advance
+        positions = np.minimum((generator.random(k) * len(edges)).astype(np.int64), len(edges) - 1).tolist()
+        candidates = []
+        c = 0
+        for position in positions:
+            v1, v2 = edges.edge(key_at(position))
+            v3 = v4 = -1
+            nonedge_found = False
+            while not nonedge_found:
+                if c + 1 >= len(candidates):
+                    candidates = generator.integers(0, len(vertices), size = 2 * k + 64).tolist()
+                    c = 0
+                v3 = vertices[candidates[c]]
+                v4 = vertices[candidates[c + 1]]
+                c += 2
+                if v4 not in adjacency_list[v3] and v3 != v4:
+                    nonedge_found = True
+            graph.replace_edge(v1, v2, v3, v4)
+
+
+class RemoveEdge(ChangeType):
+    """ Random edge removal. """
+    name = "remove-edge"
+
+    def feasible(self, graph):
+        return graph.range_min_m <= graph.m - 1 <= graph.range_max_m
+
+    def apply(self, graph):
+        v1, v2 = graph.edges.choose_random(graph.random)
+        graph.remove_edge(v1, v2)
+        graph.update_bounds()
+
+
+class RemoveVertex(ChangeType):
+    """
+    Random vertex removal, together with all edges of the vertex. Vertex removal is only allowed if
+        1) the interesting range of parameters would be retained,
+        2) at least one non-edge would still exist (corner case for small n),
+        3) current vertex count >= 0.1 * original vertex count.
+    Start and end vertices are never removed.
+    """
+    name = "remove-vertex"
+    uses_degree_index = True
+
+    def feasible(self, graph):
+        if graph.n < 0.1 * graph.initial_n:
+            return False
+        # same probability as succeeding in one of 10 tries, where each try draws a vertex id from [0, initial_n)
+        removable = graph.removable_vertex_count()
+        return removable > 0 and graph.random.random() < 1 - math.pow(1 - removable / graph.initial_n, 10)
+
+    def apply(self, graph):
+        degree_index = graph.degree_index
+        removable = graph.removable_vertex_count()
+        excluded_degree = graph.m - (graph.n - 1) * (graph.n - 2) // 2
+        candidates = degree_index.range_count
+        if degree_index.low <= excluded_degree <= degree_index.high:
+            candidates -= degree_index.count(excluded_degree)
+        vertex_found = False
+        while not vertex_found:
+            if 4 * removable >= len(graph.active_vertices):
+                v_id = graph.active_vertices.choose_random(graph.random)
+            else:
+                # removable vertices are rare: choose among the vertices with a removable degree
+                v_id = degree_index.choose(graph.random.randrange(candidates), excluded_degree)
+            if v_id != graph.start_vertex and v_id != graph.end_vertex and graph.is_removable_degree(len(graph.adjacency_list[v_id])):
+                vertex_found = True
+        graph.remove_vertex(v_id)
+        graph.update_bounds()
+
+
+class InsertEdge(ChangeType):
+    """ Random edge insertion between two disconnected active vertices. At least one non-edge remains after the insertion, as for vertex removals. """
+    name = "insert-edge"
+
+    def feasible(self, graph):
+        return graph.range_min_m <= graph.m + 1 <= graph.range_max_m and graph.m + 1 < graph.n * (graph.n - 1) // 2
+
+    def apply(self, graph):
+        v, v2 = graph.choose_non_edge()
+        graph.add_edge(v, v2)
+        graph.update_bounds()
+
+
+class InsertVertex(ChangeType):
+    """ Insertion of a random removed vertex, which becomes active again without any edges. """
+    name = "insert-vertex"
+
+    def feasible(self, graph):
+        return len(graph.removed_vertices) > 0 and graph.vertex_insertion_min_m <= graph.m <= graph.vertex_insertion_max_m
+
+    def apply(self, graph):
+        graph.add_vertex(graph.removed_vertices.choose_random(graph.random))
+        graph.update_bounds()
+
+
+def create_changes(model):
+    """
+    Returns the change types of a model configuration. Edge swap is always included,
+    'e' and 'v' include edge and vertex removals, 'E' and 'V' include edge and vertex insertions (e.g. 'basic', 'ev', 'eE').
+    """
+    changes = [SwapEdge()]
+    if "v" in model:
+        changes.append(RemoveVertex())
+    if "e" in model:
+        changes.append(RemoveEdge())
+    if "E" in model:
+        changes.append(InsertEdge())
+    if "V" in model:
+        changes.append(InsertVertex())
+    return changes
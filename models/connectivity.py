@@ -0,0 +1,128 @@
+"""
+Dynamic connectivity oracle of the evolving graph model.
+
+The oracle is a listener of EvolvingGraph (see EvolvingGraph.add_listener), which is notified after every edge change,
+and answers whether two vertices are connected in O(1) by comparing component labels.
+"""
+
+from array import array
+
+
+class ConnectivityOracle(object):
+    """
+    Spanning forest of the graph, with a component label for every vertex.
+        - Inserting an edge between two components makes it a tree edge, and relabels the smaller component.
+        - Deleting a non-tree edge changes nothing.
+        - Deleting a tree edge splits its tree in two sides. The smaller side is found by searching both sides
+          of the tree in turns, and the graph edges of the smaller side are searched for a replacement edge
+          to the other side. Without a replacement edge, the smaller side becomes a new component.
+    All costs are proportional to the smaller side of the change, which is small for most changes of random graphs.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.reset()
+
+    def reset(self):
+        """ Builds the spanning forest of the current graph with a breadth-first search from every unvisited vertex. """
+        n = len(self.graph.adjacency_list)
+        adjacency_list = self.graph.adjacency_list
+        self.tree = [set() for _ in range(n)]
+        self.component = array('i', [-1]) * n
+        self.members = [set() for _ in range(n)]
+        self.free_labels = []
+        for root in range(n):
+            if self.component[root] != -1:
+                continue
+            self.component[root] = root
+            members = self.members[root]
+            members.add(root)
+            new_vertices = [root]
+            for v in new_vertices:
+                for v2 in adjacency_list[v]:
+                    if self.component[v2] == -1:
+                        self.component[v2] = root
+                        members.add(v2)
+                        self.tree[v].add(v2)
+                        self.tree[v2].add(v)
+                        new_vertices.append(v2)
+        for label in range(n):
+            if len(self.members[label]) == 0:
+                self.free_labels.append(label)
+
+    def fork(self, graph):
+        """ Returns a copy of the oracle for a fork of the graph. """
+        oracle = ConnectivityOracle.__new__(ConnectivityOracle)
+        oracle.graph = graph
+        oracle.tree = [set(neighbors) for neighbors in self.tree]
+        oracle.component = array('i', self.component)
+        oracle.members = [set(members) for members in self.members]
+        oracle.free_labels = list(self.free_labels)
+        return oracle
+
+    def connected(self, v, v2):
+        return self.component[v] == self.component[v2]
+
+    def component_count(self, vertices = None):
+        """ Number of components, optionally counting only the components that contain one of the given vertices. """
+        if vertices is None:
+            return len(self.members) - len(self.free_labels)
+        return len(set(self.component[v] for v in vertices))
+
+    def edge_added(self, v, v2):
+        label = self.component[v]
+        label2 = self.component[v2]
+        if label == label2:
+            return
+        self.tree[v].add(v2)
+        self.tree[v2].add(v)
+        if len(self.members[label]) < len(self.members[label2]):
+            label, label2 = label2, label
+        # relabel the smaller component label2
+        for u in self.members[label2]:
+            self.component[u] = label
+        self.members[label] |= self.members[label2]
+        self.members[label2] = set()
+        self.free_labels.append(label2)
+
+    def edge_removed(self, v, v2):
+        if v2 not in self.tree[v]:
+            return
+        self.tree[v].remove(v2)
+        self.tree[v2].remove(v)
+        side = self._smaller_side(v, v2)
+        adjacency_list = self.graph.adjacency_list
+        for u in side:
+            for u2 in adjacency_list[u]:
+                if u2 not in side:
+                    self.tree[u].add(u2)
+                    self.tree[u2].add(u)
+                    return
+        label = self.component[v]
+        new_label = self.free_labels.pop()
+        for u in side:
+            self.component[u] = new_label
+        self.members[label] -= side
+        self.members[new_label] = side
+
+    def _smaller_side(self, v, v2):
+        """ Returns the vertices of the smaller of the two trees containing v and v2, searching both trees in turns. """
+        sides = [[v], [v2]]
+        seen = [set([v]), set([v2])]
+        next_position = [0, 0]
+        while True:
+            for i in range(2):
+                if next_position[i] == len(sides[i]):
+                    return seen[i]
+                u = sides[i][next_position[i]]
+                next_position[i] += 1
+                for u2 in self.tree[u]:
+                    if u2 not in seen[i]:
+                        seen[i].add(u2)
+                        sides[i].append(u2)
+
+    def vertex_added(self, v):
+        pass
+
+    def vertex_removed(self, v):
+        pass
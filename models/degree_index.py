@@ -0,0 +1,90 @@
+"""
+Degree index used by the unweighted models with vertex removals.
+"""
+
+from array import array
+
+
+class DegreeIndex(object):
+    """
+    Buckets of vertices by degree, together with the number of indexed vertices whose degree lies in a range [low, high].
+    Moving a vertex between buckets costs O(1), shifting the range by s degrees costs O(s).
+    """
+
+    def __init__(self, n):
+        self.buckets = [array('i') for _ in range(n)]
+        self.position = array('i', [-1]) * n
+        self.low = 0
+        self.high = -1
+        self.range_count = 0
+
+    def copy(self):
+        index = DegreeIndex(0)
+        index.buckets = [array('i', bucket) for bucket in self.buckets]
+        index.position = array('i', self.position)
+        index.low = self.low
+        index.high = self.high
+        index.range_count = self.range_count
+        return index
+
+    def count(self, degree):
+        """ Number of indexed vertices with the given degree. """
+        if 0 <= degree < len(self.buckets):
+            return len(self.buckets[degree])
+        return 0
+
+    def add(self, v, degree):
+        bucket = self.buckets[degree]
+        self.position[v] = len(bucket)
+        bucket.append(v)
+        if self.low <= degree <= self.high:
+            self.range_count += 1
+
+    def remove(self, v, degree):
+        bucket = self.buckets[degree]
+        position = self.position[v]
+        last_vertex = bucket.pop()
+        if position != len(bucket):
+            bucket[position] = last_vertex
+            self.position[last_vertex] = position
+        self.position[v] = -1
+        if self.low <= degree <= self.high:
+            self.range_count -= 1
+
+    def move(self, v, old_degree, new_degree):
+        position = self.position
+        bucket = self.buckets[old_degree]
+        last_vertex = bucket.pop()
+        if position[v] != len(bucket):
+            bucket[position[v]] = last_vertex
+            position[last_vertex] = position[v]
+        bucket = self.buckets[new_degree]
+        position[v] = len(bucket)
+        bucket.append(v)
+        self.range_count += (self.low <= new_degree <= self.high) - (self.low <= old_degree <= self.high)
+
+    def _count_between(self, low, high):
+        return sum(len(self.buckets[d]) for d in range(max(low, 0), min(high, len(self.buckets) - 1) + 1))
+
+    def set_range(self, low, high):
+        """ Sets the counted degree range to [low, high], updating the count by the degrees that entered or left the range. """
+        low = max(low, 0)
+        high = min(high, len(self.buckets) - 1)
+        if low > high or self.low > self.high or low > self.high or self.low > high:
+            self.range_count = self._count_between(low, high)
+        else:
+            self.range_count += self._count_between(low, self.low - 1) - self._count_between(self.low, low - 1)
+            self.range_count += self._count_between(self.high + 1, high) - self._count_between(high + 1, self.high)
+        self.low = low
+        self.high = high
+
+    def choose(self, k, excluded_degree = -1):
+        """ Returns the k-th vertex with degree in the counted range, skipping the bucket of excluded_degree. """
+        for degree in range(self.low, self.high + 1):
+            if degree == excluded_degree:
+                continue
+            bucket = self.buckets[degree]
+            if k < len(bucket):
+                return bucket[k]
+            k -= len(bucket)
+        raise IndexError(k)
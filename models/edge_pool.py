@@ -0,0 +1,229 @@
+"""
+Edge pool shared by the unweighted models.
+"""
+
+from array import array
+
+import numpy as np
+
+
+class EdgePool(object):
+    """
+    Set of undirected edges that supports addition, removal and uniform random selection in constant time.
+    Edge (v, v2) is stored as a packed integer key lo * n + hi, where lo = min(v, v2) and hi = max(v, v2).
+    Keys are kept in an int64 array, and a dictionary maps every key to its position in the array.
+    """
+
+    def __init__(self, n):
+        self.n = n
+        self.keys = array('q')
+        self.key_to_position = {}
+
+    def key(self, v, v2):
+        if v < v2:
+            return v * self.n + v2
+        return v2 * self.n + v
+
+    def edge(self, key):
+        """ Returns the edge (lo, hi) stored under key. """
+        return divmod(key, self.n)
+
+    def add_key(self, key):
+        if key in self.key_to_position:
+            return False
+        self.key_to_position[key] = len(self.keys)
+        self.keys.append(key)
+        return True
+
+    def remove_key(self, key):
+        position = self.key_to_position.pop(key)
+        last_key = self.keys.pop()
+        if position != len(self.keys):
+            self.keys[position] = last_key
+            self.key_to_position[last_key] = position
+
+    def add(self, v, v2):
+        """ Adds edge (v, v2), returns False if the edge is already in the pool. """
+        return self.add_key(self.key(v, v2))
+
+    def remove(self, v, v2):
+        """ Removes edge (v, v2), raises KeyError if the edge is not in the pool. """
+        self.remove_key(self.key(v, v2))
+
+    def replace(self, v1, v2, v3, v4):
+        """ Replaces edge (v1, v2) by a new edge (v3, v4) at the same position of the pool. """
+        key = self.key(v3, v4)
+        position = self.key_to_position.pop(self.key(v1, v2))
+        self.keys[position] = key
+        self.key_to_position[key] = position
+
+    def contains(self, v, v2):
+        return self.key(v, v2) in self.key_to_position
+
+    def key_at(self, position):
+        return self.keys[position]
+
+    def position(self, key):
+        """ Returns the position of key in the pool, or -1 if the key is not in the pool. """
+        return self.key_to_position.get(key, -1)
+
+    def fork(self):
+        """
+        Returns two pools (for the model and its fork) that share the keys of this pool.
+        This pool must not be modified afterwards.
+        """
+        return EdgePoolOverlay(self), EdgePoolOverlay(self)
+
+    def choose_random(self, rng):
+        """ Returns a uniformly random edge (lo, hi), drawn with rng (the random stream of the model). """
+        return divmod(self.keys[rng.randrange(len(self.keys))], self.n)
+
+    def add_edges(self, lo, hi):
+        """ Adds edges (lo[i], hi[i]) given as NumPy arrays. """
+        keys = np.minimum(lo, hi).astype(np.int64) * self.n + np.maximum(lo, hi)
+        if len(self.keys) == 0:
+            keys = keys[np.sort(np.unique(keys, return_index = True)[1])]
+            self.keys.frombytes(keys.tobytes())
+            self.key_to_position = dict(zip(keys.tolist(), range(len(keys))))
+            return
+        for key in keys.tolist():
+            self.add_key(key)
+
+    def remove_edges(self, lo, hi):
+        """ Removes edges (lo[i], hi[i]) given as NumPy arrays. """
+        keys = np.minimum(lo, hi).astype(np.int64) * self.n + np.maximum(lo, hi)
+        for key in keys.tolist():
+            self.remove_key(key)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __iter__(self):
+        """ Iterates over the edges (lo, hi) in the order of the pool. """
+        n = self.n
+        for key in self.keys:
+            yield divmod(key, n)
+
+
+class EdgePoolOverlay(object):
+    """
+    Edge pool with the same interface as EdgePool, which shares the keys of a base pool that is not modified any more,
+    and stores only its differences to the base. Positions are dense as in EdgePool:
+        - overridden[position] is the key at a position whose key differs from the base,
+        - moved[key] is the position of a key whose position differs from the base, or None if the key was removed.
+    Once the differences outgrow the pool, they are merged into a new private base pool.
+    """
+
+    def __init__(self, base, overridden = None, moved = None, size = None):
+        self.n = base.n
+        self.base = base
+        self.overridden = {} if overridden is None else overridden
+        self.moved = {} if moved is None else moved
+        self.size = len(base) if size is None else size
+
+    def key(self, v, v2):
+        if v < v2:
+            return v * self.n + v2
+        return v2 * self.n + v
+
+    def edge(self, key):
+        """ Returns the edge (lo, hi) stored under key. """
+        return divmod(key, self.n)
+
+    def key_at(self, position):
+        key = self.overridden.get(position)
+        if key is None:
+            return self.base.key_at(position)
+        return key
+
+    def position(self, key):
+        """ Returns the position of key in the pool, or -1 if the key is not in the pool. """
+        if key in self.moved:
+            position = self.moved[key]
+            return -1 if position is None else position
+        return self.base.position(key)
+
+    def _merge(self):
+        """ Replaces the base by a new pool with the current keys, once the differences are larger than the pool. """
+        if len(self.moved) + len(self.overridden) > max(2 * self.size, 1024):
+            base = EdgePool(self.n)
+            keys = [self.key_at(position) for position in range(self.size)]
+            base.keys = array('q', keys)
+            base.key_to_position = dict(zip(keys, range(self.size)))
+            self.base = base
+            self.overridden = {}
+            self.moved = {}
+
+    def add_key(self, key):
+        if self.position(key) != -1:
+            return False
+        self.overridden[self.size] = key
+        self.moved[key] = self.size
+        self.size += 1
+        self._merge()
+        return True
+
+    def remove_key(self, key):
+        position = self.position(key)
+        if position == -1:
+            raise KeyError(key)
+        self.size -= 1
+        if position != self.size:
+            last_key = self.key_at(self.size)
+            self.overridden[position] = last_key
+            self.moved[last_key] = position
+        self.overridden.pop(self.size, None)
+        self.moved[key] = None
+        self._merge()
+
+    def add(self, v, v2):
+        """ Adds edge (v, v2), returns False if the edge is already in the pool. """
+        return self.add_key(self.key(v, v2))
+
+    def remove(self, v, v2):
+        """ Removes edge (v, v2), raises KeyError if the edge is not in the pool. """
+        self.remove_key(self.key(v, v2))
+
+    def replace(self, v1, v2, v3, v4):
+        """ Replaces edge (v1, v2) by a new edge (v3, v4) at the same position of the pool. """
+        key = self.key(v3, v4)
+        old_key = self.key(v1, v2)
+        position = self.position(old_key)
+        if position == -1:
+            raise KeyError(old_key)
+        self.overridden[position] = key
+        self.moved[old_key] = None
+        self.moved[key] = position
+        self._merge()
+
+    def contains(self, v, v2):
+        return self.position(self.key(v, v2)) != -1
+
+    def fork(self):
+        """ Returns two pools (for the model and its fork), the fork copies only the differences to the shared base. """
+        return self, EdgePoolOverlay(self.base, dict(self.overridden), dict(self.moved), self.size)
+
+    def choose_random(self, rng):
+        """ Returns a uniformly random edge (lo, hi), drawn with rng (the random stream of the model). """
+        return divmod(self.key_at(rng.randrange(self.size)), self.n)
+
+    def add_edges(self, lo, hi):
+        """ Adds edges (lo[i], hi[i]) given as NumPy arrays. """
+        keys = np.minimum(lo, hi).astype(np.int64) * self.n + np.maximum(lo, hi)
+        for key in keys.tolist():
+            self.add_key(key)
+
+    def remove_edges(self, lo, hi):
+        """ Removes edges (lo[i], hi[i]) given as NumPy arrays. """
+        keys = np.minimum(lo, hi).astype(np.int64) * self.n + np.maximum(lo, hi)
+        for key in keys.tolist():
+            self.remove_key(key)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        """ Iterates over the edges (lo, hi) in the order of the pool. """
+        n = self.n
+        for position in range(self.size):
+            yield divmod(self.key_at(position), n)
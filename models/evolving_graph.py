@@ -0,0 +1,415 @@
+"""
+Evolving graph model: a random unweighted graph that changes with a configurable mix of change types.
+
+All change types (see models/changes.py) mutate the graph only through the primitives
+add_edge, remove_edge, replace_edge, add_vertex and remove_vertex,
+which keep the adjacency list, the edge pool, the vertex pools and the degree index consistent.
+
+Listeners (e.g. the connectivity oracle, see add_listener) are notified after every primitive mutation.
+
+A model can be forked into an independent model that shares unchanged storage with it (see fork):
+neighbor sets are copied on the first modification, and the edge pool stores only its differences to the shared pool.
+"""
+
+import copy
+import math
+import random
+
+from models.adjacency import create_adjacency, insert_edges, resolve_storage
+from models.changes import create_changes
+from models.connectivity import ConnectivityOracle
+from models.degree_index import DegreeIndex
+from models.edge_pool import EdgePool
+from models.generation import GENERATION_TYPES, random_edges, random_edges_compat
+from models.model import Graph
+from models.random_stream import RandomStream
+from models.vertex_pool import VertexPool
+
+class EvolvingGraph(Graph):
+    # model configuration used if none is given, see create_changes
+    default_model = "basic"
+
+    def init_specific(self, m, initialize = True, storage = "set", generation = "numpy", model = None, connectivity = False):
+        """
+        model is a configuration string for create_changes, or a list of change types (e.g. [SwapEdge(2), RemoveEdge()]).
+        If connectivity is True, the model maintains a connectivity oracle, which validates empty answers in O(1).
+        """
+        self.m = m
+        self.initial_n = self.n
+        self.storage = resolve_storage(self.n, storage)
+        self.adjacency_list = create_adjacency(self.n, self.storage, 2 * m // self.n)
+        if initialize:
+            self.interesting_range_check()
+        self.start_vertex = 0
+        self.end_vertex = self.n - 1
+        self.edges = EdgePool(self.n)
+        self.initialize = initialize
+        if generation not in GENERATION_TYPES:
+            raise ValueError("Unknown generation type '{}', use one of: {}".format(generation, ", ".join(GENERATION_TYPES)))
+        self.generation = generation
+        if model is None:
+            model = self.default_model
+        self.changes = create_changes(model) if isinstance(model, str) else list(model)
+        self.uniform_weights = len(set(change.weight for change in self.changes)) == 1
+        self.active_vertices = VertexPool(self.n)
+        self.removed_vertices = VertexPool(self.n, full = False)
+        self.degree_index = None
+        # vertices whose neighbor sets are not shared with a fork, None if no neighbor set is shared
+        self.owned_vertices = None
+        self.listeners = {}
+        self.connectivity = connectivity
+
+    def interesting_range_check(self, m_subtraction = 0, n_subtraction = 0):
+        if self.m - m_subtraction < (self.n - n_subtraction) * math.log(self.n - n_subtraction):
+            if n_subtraction == 0 and m_subtraction == 0:
+                print("The range of parameters is not interesting: Number of edges m is lower than n log n")
+            return 1
+        if self.m - m_subtraction > math.pow((self.n - n_subtraction), 3/2):
+            if n_subtraction == 0 and m_subtraction == 0:
+                print("The range of parameters is not interesting: Number of edges m is higher than n^(3/2)")
+            return 2
+        return 0
+
+    def construct_random_graph(self):
+        """ Randomly creates m edges. Each edge has an equal probability to appear in the graph. """
+        if self.initialize:
+            if self.generation == "compat":
+                lo, hi = random_edges_compat(random.Random(self.rand_seed), self.n, self.m)
+            else:
+                lo, hi = random_edges(self.random.generator, self.n, self.m)
+            insert_edges(self.adjacency_list, lo, hi)
+            self.edges.add_edges(lo, hi)
+        self.index_degrees()
+        if self.connectivity:
+            self.add_listener("connectivity", ConnectivityOracle(self))
+
+    def add_listener(self, name, listener):
+        """
+        Adds a listener, which is notified by calls of edge_added(v, v2), edge_removed(v, v2), vertex_added(v) and vertex_removed(v)
+        after every primitive mutation, and of reset() after the edges are imported. fork(graph) returns a copy of the listener for a fork.
+        """
+        self.listeners[name] = listener
+
+    def index_degrees(self):
+        """ Builds the index of active vertices by degree if a change type uses it, which is used to find removable vertices without sampling. """
+        if any(change.uses_degree_index for change in self.changes):
+            self.degree_index = DegreeIndex(self.initial_n)
+            for v in self.active_vertices:
+                self.degree_index.add(v, len(self.adjacency_list[v]))
+        self.bounds_n = -1
+        self.update_bounds()
+
+    def update_bounds(self):
+        """
+        Updates the bounds on m used by the change types after a change of n or m:
+            - [range_min_m, range_max_m] is the interesting range for n vertices,
+            - [vertex_removal_min_m, vertex_removal_max_m] and [vertex_insertion_min_m, vertex_insertion_max_m] for n - 1 and n + 1 vertices.
+        Removing a vertex of degree d retains the interesting range of parameters iff (n-1) log(n-1) <= m - d <= (n-1)^(3/2),
+        so the degree index counts the vertices with degree in [m - vertex_removal_max_m, m - vertex_removal_min_m].
+        """
+        if self.n != self.bounds_n:
+            self.bounds_n = self.n
+            self.range_min_m = math.ceil(self.n * math.log(self.n)) if self.n >= 1 else 1
+            self.range_max_m = math.floor(math.pow(self.n, 3/2))
+            self.vertex_removal_min_m = math.ceil((self.n - 1) * math.log(self.n - 1)) if self.n >= 2 else 1
+            self.vertex_removal_max_m = math.floor(math.pow((self.n - 1), 3/2)) if self.n >= 2 else 0
+            self.vertex_insertion_min_m = math.ceil((self.n + 1) * math.log(self.n + 1))
+            self.vertex_insertion_max_m = math.floor(math.pow((self.n + 1), 3/2))
+        if self.degree_index is not None:
+            self.degree_index.set_range(self.m - self.vertex_removal_max_m, self.m - self.vertex_removal_min_m)
+
+    def is_removable_degree(self, degree):
+        """ Checks whether removing a vertex of the given degree is allowed (conditions 1 and 2 of RemoveVertex). """
+        if degree < self.degree_index.low or degree > self.degree_index.high:
+            return False
+        return (self.n - 1) * (self.n - 2) // 2 != self.m - degree
+
+    def removable_vertex_count(self):
+        """ Number of active vertices that can be removed, start and end vertices are never removed. """
+        count = self.degree_index.range_count
+        excluded_degree = self.m - (self.n - 1) * (self.n - 2) // 2
+        if self.degree_index.low <= excluded_degree <= self.degree_index.high:
+            count -= self.degree_index.count(excluded_degree)
+        for v in set([self.start_vertex, self.end_vertex]):
+            if self.is_removable_degree(len(self.adjacency_list[v])):
+                count -= 1
+        return count
+
+    def degree_changed(self, v, change):
+        """ Moves v to its new degree bucket after its degree has changed by change. """
+        degree = len(self.adjacency_list[v])
+        self.degree_index.move(v, degree - change, degree)
+
+    def choose_non_edge(self):
+        """ Returns a uniformly random pair of distinct, disconnected active vertices. """
+        while True:
+            v = self.active_vertices.choose_random(self.random)
+            v2 = self.active_vertices.choose_random(self.random)
+            if v2 not in self.adjacency_list[v] and v != v2:
+                return v, v2
+
+    def own(self, *vertices):
+        """ Copies the neighbor sets of vertices that are shared with a fork, before they are modified. """
+        for v in vertices:
+            if v not in self.owned_vertices:
+                self.adjacency_list[v] = set(self.adjacency_list[v])
+                self.owned_vertices.add(v)
+        if len(self.owned_vertices) == len(self.adjacency_list):
+            self.owned_vertices = None
+
+    def add_edge(self, v, v2):
+        if self.owned_vertices is not None:
+            self.own(v, v2)
+        neighbors = self.adjacency_list[v]
+        neighbors2 = self.adjacency_list[v2]
+        neighbors.add(v2)
+        neighbors2.add(v)
+        self.edges.add(v, v2)
+        self.m += 1
+        if self.degree_index is not None:
+            self.degree_index.move(v, len(neighbors) - 1, len(neighbors))
+            self.degree_index.move(v2, len(neighbors2) - 1, len(neighbors2))
+        if self.listeners:
+            for listener in self.listeners.values():
+                listener.edge_added(v, v2)
+
+    def remove_edge(self, v, v2):
+        if self.owned_vertices is not None:
+            self.own(v, v2)
+        neighbors = self.adjacency_list[v]
+        neighbors2 = self.adjacency_list[v2]
+        neighbors.remove(v2)
+        neighbors2.remove(v)
+        self.edges.remove(v, v2)
+        self.m -= 1
+        if self.degree_index is not None:
+            self.degree_index.move(v, len(neighbors) + 1, len(neighbors))
+            self.degree_index.move(v2, len(neighbors2) + 1, len(neighbors2))
+        if self.listeners:
+            for listener in self.listeners.values():
+                listener.edge_removed(v, v2)
+
+    def replace_edge(self, v1, v2, v3, v4):
+        """ Replaces edge (v1, v2) by a non-edge (v3, v4), keeping the position of the edge in the edge pool. """
+        if self.owned_vertices is not None:
+            self.own(v1, v2, v3, v4)
+        self.adjacency_list[v1].remove(v2)
+        self.adjacency_list[v2].remove(v1)
+        # listeners see the removal before the inserted edge is in the adjacency list (e.g. the oracle must not use it as a replacement edge)
+        if self.listeners:
+            for listener in self.listeners.values():
+                listener.edge_removed(v1, v2)
+        self.adjacency_list[v3].add(v4)
+        self.adjacency_list[v4].add(v3)
+        self.edges.replace(v1, v2, v3, v4)
+        if self.degree_index is not None:
+            self.degree_changed(v1, -1)
+            self.degree_changed(v2, -1)
+            self.degree_changed(v3, 1)
+            self.degree_changed(v4, 1)
+        if self.listeners:
+            for listener in self.listeners.values():
+                listener.edge_added(v3, v4)
+
+    def add_vertex(self, v):
+        """ Activates a removed vertex v, which has no edges. """
+        self.removed_vertices.remove(v)
+        self.active_vertices.add(v)
+        self.n += 1
+        if self.degree_index is not None:
+            self.degree_index.add(v, 0)
+        for listener in self.listeners.values():
+            listener.vertex_added(v)
+
+    def remove_vertex(self, v):
+        """ Removes all edges of an active vertex v, and deactivates it. """
+        # sorted, so that the order of the edge pool does not depend on the iteration order of the neighbor set
+        neighbors = sorted(self.adjacency_list[v])
+        degree = len(neighbors)
+        if self.owned_vertices is not None:
+            self.own(v, *neighbors)
+        for v2 in neighbors:
+            self.adjacency_list[v].remove(v2)
+            neighbors2 = self.adjacency_list[v2]
+            neighbors2.remove(v)
+            self.edges.remove(v, v2)
+            self.m -= 1
+            if self.degree_index is not None:
+                self.degree_index.move(v2, len(neighbors2) + 1, len(neighbors2))
+            if self.listeners:
+                for listener in self.listeners.values():
+                    listener.edge_removed(v, v2)
+        self.active_vertices.remove(v)
+        self.removed_vertices.add(v)
+        self.n -= 1
+        if self.degree_index is not None:
+            self.degree_index.remove(v, degree)
+        for listener in self.listeners.values():
+            listener.vertex_removed(v)
+
+    def fork(self, rand_seed = None):
+        """
+        Returns an independent model in the same state, which shares unchanged storage with this model.
+        The cost of the fork is O(n) plus the number of edge changes since the edge pool was last merged, and
+        the shared neighbor sets are copied by whichever model modifies them first (compact and bitset storage are copied at once).
+        The fork continues the random stream of this model, so it makes the same changes as this model would,
+        unless a new rand_seed is given (copied neighbor sets may iterate their neighbors in a different order).
+        """
+        fork = copy.copy(self)
+        if self.storage == "set":
+            fork.adjacency_list = list(self.adjacency_list)
+            self.owned_vertices = set()
+            fork.owned_vertices = set()
+        else:
+            fork.adjacency_list = self.adjacency_list.copy()
+        self.edges, fork.edges = self.edges.fork()
+        fork.active_vertices = self.active_vertices.copy()
+        fork.removed_vertices = self.removed_vertices.copy()
+        if self.degree_index is not None:
+            fork.degree_index = self.degree_index.copy()
+        fork.listeners = {name: listener.fork(fork) for name, listener in self.listeners.items()}
+        if rand_seed is None:
+            fork.random = self.random.copy()
+        else:
+            fork.rand_seed = rand_seed
+            fork.random = RandomStream(rand_seed)
+        return fork
+
+    def snapshot(self):
+        """ Returns a snapshot of the current state, which can be restored any number of times with restore(). """
+        return self.fork()
+
+    def restore(self, snapshot):
+        """ Returns the model (including its random stream) to the state of a snapshot. """
+        self.__dict__.update(snapshot.fork().__dict__)
+        # listeners of the restored state belong to this model, not to the temporary fork
+        self.listeners = {name: listener.fork(self) for name, listener in self.listeners.items()}
+
+    def probe(self, v):
+        """ Vertex probe - returns the list of neighbors of v. """
+        return self.adjacency_list[v]
+
+    def change(self):
+        """ Picks one of the feasible change types, with probability proportional to its weight, and performs it. """
+        if len(self.changes) == 1:
+            if self.changes[0].feasible(self):
+                self.changes[0].apply(self)
+            return
+        possible_changes = [change for change in self.changes if change.feasible(self)]
+        if len(possible_changes) == 0:
+            return
+        if self.uniform_weights:
+            change = possible_changes[self.random.randrange(len(possible_changes))]
+        else:
+            r = self.random.random() * sum(change.weight for change in possible_changes)
+            for change in possible_changes:
+                r -= change.weight
+                if r < 0:
+                    break
+        change.apply(self)
+
+    def change_many(self, k):
+        """ Performs k changes, equivalent to calling change() k times. """
+        if len(self.changes) == 1:
+            if self.changes[0].feasible(self):
+                self.changes[0].apply_many(self, k)
+            return
+        for _ in range(k):
+            self.change()
+
+    def validate(self, path, connected = None):
+        """
+        Checks whether the answer of path from path_v1 to path_v2 is valid in the current state of the graph.
+        connected is whether start and end vertices are connected in the current state, if it is known (e.g. precomputed for datasets).
+        If path does not follow the right structure, returns -1
+        If the answer is invalid, returns 1
+        If the answer is valid, returns 0
+
+        The answer is valid if one of the conditions holds:
+            1) path = [], and start and end vertices are not connected
+            2) path != [], and the path between start and end vertices is valid
+        """
+        if len(path) > 0:
+            if path[0] != self.start_vertex:
+                print("Algorithm error: Returned Path does not start with start_vertex!")
+                return -1
+            if path[len(path)-1] != self.end_vertex:
+                print("Algorithm error: Returned Path does not end with end_vertex!")
+                return -1
+            path_vertices = set()
+            for v in path:
+                if v < 0 or v >= self.initial_n:
+                    print("Algorithm error: Vertex out of range!")
+                    return -1
+                if v in path_vertices:
+                    print("Algorithm error: Vertex appears twice!")
+                    return -1
+                path_vertices.add(v)
+
+        if len(path) == 0 and connected is not None:
+            return 1 if connected else 0
+        if len(path) == 0 and "connectivity" in self.listeners:
+            return 1 if self.start_vertex != self.end_vertex and self.listeners["connectivity"].connected(self.start_vertex, self.end_vertex) else 0
+        if len(path) == 0 and self.storage == "bitset":
+            return 1 if self.start_vertex != self.end_vertex and self.adjacency_list.connected(self.start_vertex, self.end_vertex) else 0
+        if len(path) == 0:     # Case 1: path = []
+            visited = [0 for i in range(self.initial_n)]
+            visited[self.start_vertex] = 1
+            new_vertices = [self.start_vertex]
+            for v in new_vertices:
+                for v2 in self.adjacency_list[v]:
+                    if visited[v2] == 0:
+                        visited[v2] = 1
+                        new_vertices.append(v2)
+                        if v2 == self.end_vertex:
+                            return 1
+        else:    # Case 2: path != []
+            for i in range(0, len(path)-1):
+                if path[i+1] not in self.adjacency_list[path[i]]:
+                    return 1
+        return 0
+
+    def import_edges(self, edges):
+        """ Replaces the current edges with a list of edges. """
+        self.adjacency_list = create_adjacency(self.initial_n, self.storage)
+        self.edges = EdgePool(self.initial_n)
+        for edge in edges:
+            if edge[1] not in self.adjacency_list[edge[0]]:
+                self.adjacency_list[edge[0]].add(edge[1])
+            if edge[0] not in self.adjacency_list[edge[1]]:
+                self.adjacency_list[edge[1]].add(edge[0])
+            self.edges.add(edge[0], edge[1])
+        self.owned_vertices = None
+        self.index_degrees()
+        for listener in self.listeners.values():
+            listener.reset()
+
+    def update_edges(self, new_edges, removed_edges):
+        """ Updates the current edges by adding a list of new edges and removing another list of edges. """
+        for edge in removed_edges:
+            if self.owned_vertices is not None:
+                self.own(edge[0], edge[1])
+            self.adjacency_list[edge[0]].remove(edge[1])
+            self.edges.remove(edge[0], edge[1])
+            if edge[0] != edge[1]:
+                self.adjacency_list[edge[1]].remove(edge[0])
+            for listener in self.listeners.values():
+                listener.edge_removed(edge[0], edge[1])
+        for edge in new_edges:
+            if self.owned_vertices is not None:
+                self.own(edge[0], edge[1])
+            if edge[1] not in self.adjacency_list[edge[0]]:
+                self.adjacency_list[edge[0]].add(edge[1])
+            if edge[0] not in self.adjacency_list[edge[1]]:
+                self.adjacency_list[edge[1]].add(edge[0])
+            self.edges.add(edge[0], edge[1])
+            for listener in self.listeners.values():
+                listener.edge_added(edge[0], edge[1])
+        if self.degree_index is not None:
+            self.index_degrees()
+
+    def set_start_vertex(self, v):
+        self.start_vertex = v
+
+    def set_end_vertex(self, v):
+        self.end_vertex = v
@@ -0,0 +1,59 @@
+"""
+Random graph generation for the unweighted models.
+
+Both generators draw ordered vertex pairs uniformly at random and reject self-loops and duplicate edges,
+so the resulting edge set is a uniformly random set of m edges.
+    - random_edges draws the candidate pairs in NumPy blocks, and removes duplicates by packed keys lo * n + hi.
+    - random_edges_compat draws the pairs one at a time from a random.Random instance,
+      and produces bit-for-bit the same edges as the original per-edge generation loop.
+"""
+
+import numpy as np
+
+GENERATION_TYPES = ["numpy", "compat"]
+
+_MAX_BLOCK = 1 << 22
+
+
+def random_edges(rng, n, m):
+    """ Returns arrays (lo, hi) of m distinct random edges (lo < hi), in the order in which they were drawn. """
+    if m > n * (n - 1) // 2:
+        raise ValueError("Cannot create {} edges in a graph with {} vertices".format(m, n))
+    keys = np.empty(0, dtype = np.int64)
+    while len(keys) < m:
+        # expected fraction of candidates that are neither self-loops nor existing edges
+        acceptance = max((1 - 1 / n) * (1 - 2 * len(keys) / (n * (n - 1))), 0.01)
+        block = min(int(1.1 * (m - len(keys)) / acceptance) + 64, _MAX_BLOCK)
+        v = rng.integers(0, n, size = block, dtype = np.int64)
+        v2 = rng.integers(0, n, size = block, dtype = np.int64)
+        distinct = v != v2
+        v, v2 = v[distinct], v2[distinct]
+        candidates = np.concatenate((keys, np.minimum(v, v2) * n + np.maximum(v, v2)))
+        # keep the first occurrence of every key, in the order of drawing
+        _, first = np.unique(candidates, return_index = True)
+        first.sort()
+        keys = candidates[first[:m]]
+    return keys // n, keys % n
+
+
+def random_edges_compat(rng, n, m):
+    """
+    Returns arrays (lo, hi) of m distinct random edges, drawn with the same random calls as the original generation loop.
+    rng is a random.Random instance, seeded with the seed that the original loop used for the global random module.
+    """
+    keys = set()
+    lo = np.empty(m, dtype = np.int64)
+    hi = np.empty(m, dtype = np.int64)
+    for edge in range(m):
+        non_edge_found = False
+        while not non_edge_found:
+            v = rng.randint(0, n - 1)
+            v2 = rng.randint(0, n - 1)
+            key = min(v, v2) * n + max(v, v2)
+            if v == v2 or key in keys:
+                continue
+            non_edge_found = True
+            keys.add(key)
+            lo[edge] = min(v, v2)
+            hi[edge] = max(v, v2)
+    return lo, hi
@@ -0,0 +1,86 @@
+"""
+Ground truth of an experiment: whether the start and end vertices are connected in every iteration of Runner.
+
+The evolution of the graph in Runner does not depend on the algorithm (probes do not change the model), so the ground truth
+of a random model is determined by its configuration (model, n, m, rand_seed, change_rate, iterations, generation),
+and the ground truth of a dataset by its timeline. It is computed once, stored in a directory of ground truth files,
+and passed to every Runner of the configuration, which then validates empty answers by lookup.
+"""
+
+import os
+import pickle
+
+import numpy as np
+
+from models.connectivity import ConnectivityOracle
+
+# part of the file names, incremented whenever the evolution of the models or the connectivity computation changes,
+# so that ground truth computed by an earlier version is not reused
+GROUND_TRUTH_VERSION = 2
+
+
+def ground_truth_name(model, n, m, rand_seed, change_rate, iterations, generation = "numpy"):
+    """ File name of the ground truth of a random model configuration (model is the model string of EvolvingGraph). """
+    return "v{}-{}-n{}-m{}-seed{}-change{}-it{}-{}.pkl".format(GROUND_TRUTH_VERSION, model or "basic", n, m, rand_seed, change_rate, iterations, generation)
+
+
+def compute_ground_truth(graph, iterations, change_rate):
+    """
+    Returns the list, whose element i is True iff the start and end vertices are connected when Runner validates the answer
+    of iteration i, i.e. after i * change_rate changes of the graph. The changes are made on a fork, so the graph does not change.
+    """
+    replay = graph.fork()
+    if "connectivity" not in replay.listeners:
+        replay.add_listener("connectivity", ConnectivityOracle(replay))
+    connected = []
+    for iteration in range(iterations):
+        connected.append(replay.validate([]) == 1)
+        replay.change_many(change_rate)
+    return connected
+
+
+def dataset_ground_truth(dataset):
+    """
+    Returns the ground truth of a dataset from its precomputed connectivity (see models/offline_connectivity.py).
+    Runner imports the edges of time step i after the answer of iteration i, so iteration 0 validates an empty graph.
+    """
+    connected = dataset["connected"]
+    return [False] + list(connected[:len(connected) - 1])
+
+
+def save_ground_truth(path, graph, connected):
+    directory = os.path.dirname(path)
+    if directory != "" and not os.path.exists(directory):
+        os.makedirs(directory)
+    ground_truth = {
+        "start_vertex": graph.start_vertex,
+        "end_vertex": graph.end_vertex,
+        "iterations": len(connected),
+        "connected": np.packbits(np.array(connected, dtype = bool)),
+    }
+    with open(path, "wb") as handle:
+        pickle.dump(ground_truth, handle, protocol = pickle.HIGHEST_PROTOCOL)
+
+
+def load_ground_truth(path, graph):
+    """ Returns the ground truth stored at path, or None if there is none for the start and end vertices of the graph. """
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as fin:
+        ground_truth = pickle.load(fin)
+    if ground_truth["start_vertex"] != graph.start_vertex or ground_truth["end_vertex"] != graph.end_vertex:
+        return None
+    return np.unpackbits(ground_truth["connected"], count = ground_truth["iterations"]).astype(bool).tolist()
+
+
+def cached_ground_truth(directory, graph, model, rand_seed, change_rate, iterations, generation = "numpy"):
+    """
+    Returns the ground truth of a newly constructed random model graph, loading it from the directory if it was computed before,
+    and computing and storing it otherwise.
+    """
+    path = os.path.join(directory, ground_truth_name(model, graph.initial_n, graph.m, rand_seed, change_rate, iterations, generation))
+    connected = load_ground_truth(path, graph)
+    if connected is None:
+        connected = compute_ground_truth(graph, iterations, change_rate)
+        save_ground_truth(path, graph, connected)
+    return connected
@@ -1,14 +1,16 @@
 import math
-import random
+
+from models.random_stream import RandomStream
 
 class Graph:
     n: int
     m: int
 
-    def __init__(self, rand_seed, n, *args):
-        random.seed(rand_seed)
+    def __init__(self, rand_seed, n, *args, **kwargs):
+        self.rand_seed = rand_seed
+        self.random = RandomStream(rand_seed)
         self.n = n
-        self.init_specific(*args)
+        self.init_specific(*args, **kwargs)
         self.construct_random_graph()
 
     def init_specific(self):
@@ -23,5 +25,10 @@ class Graph:
     def change(self):
         pass
 
+    def change_many(self, k):
+        """ Performs k changes, equivalent to calling change() k times. """
+        for _ in range(k):
+            self.change()
+
     def validate(self):
         pass
\ No newline at end of file
@@ -0,0 +1,126 @@
+"""
+Offline connectivity of two vertices over a known edge timeline (the datasets).
+
+Every edge exists during an interval of time steps [start, end). The intervals are inserted into a segment tree over
+the time steps, and a depth-first traversal of the tree unites the endpoints of the edges of every node in a union-find,
+which is rolled back when the traversal leaves the node. At a leaf, the union-find contains exactly the edges of its time step.
+For E edge lifetimes and T time steps, the traversal costs O((n + E log T) log n).
+"""
+
+import os
+import pickle
+
+
+class RollbackUnionFind(object):
+    """ Union-find with union by size and without path compression, whose unions can be undone in reverse order. """
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.size = [1] * n
+        # merged roots of the unions, -1 for unions of already connected vertices
+        self.history = []
+
+    def find(self, v):
+        while self.parent[v] != v:
+            v = self.parent[v]
+        return v
+
+    def union(self, v, v2):
+        root = self.find(v)
+        root2 = self.find(v2)
+        if root == root2:
+            self.history.append(-1)
+            return
+        if self.size[root] < self.size[root2]:
+            root, root2 = root2, root
+        self.parent[root2] = root
+        self.size[root] += self.size[root2]
+        self.history.append(root2)
+
+    def rollback(self, count):
+        """ Undoes the last count unions. """
+        for _ in range(count):
+            root2 = self.history.pop()
+            if root2 != -1:
+                root = self.parent[root2]
+                self.size[root] -= self.size[root2]
+                self.parent[root2] = root2
+
+
+def edge_lifetimes(dataset):
+    """
+    Returns the list of edge lifetimes (v, v2, start, end) of a dataset, where edge (v, v2) exists in time steps [start, end).
+    The edges of time step 0 are dataset["edges"][0], and time step t applies dataset["removed_edges"][t] and dataset["new_edges"][t].
+    Self-loops are skipped, as they do not change connectivity.
+    """
+    time_steps = len(dataset["edges"])
+    start = dict()
+    lifetimes = []
+    for edge in dataset["edges"][0]:
+        start.setdefault((min(edge), max(edge)), 0)
+    for t in range(1, time_steps):
+        for edge in dataset["removed_edges"][t]:
+            key = (min(edge), max(edge))
+            if key in start:
+                lifetimes.append((key[0], key[1], start.pop(key), t))
+        for edge in dataset["new_edges"][t]:
+            start.setdefault((min(edge), max(edge)), t)
+    for key, t in start.items():
+        lifetimes.append((key[0], key[1], t, time_steps))
+    return [lifetime for lifetime in lifetimes if lifetime[0] != lifetime[1]]
+
+
+def offline_connectivity(n, time_steps, lifetimes, v, v2):
+    """ Returns a list, whose element t is True iff v and v2 are connected in time step t. """
+    size = 1
+    while size < time_steps:
+        size *= 2
+    node_edges = [[] for _ in range(2 * size)]
+    for u, u2, start, end in lifetimes:
+        left = start + size
+        right = end + size
+        while left < right:
+            if left & 1:
+                node_edges[left].append((u, u2))
+                left += 1
+            if right & 1:
+                right -= 1
+                node_edges[right].append((u, u2))
+            left //= 2
+            right //= 2
+
+    union_find = RollbackUnionFind(n)
+    connected = [False] * time_steps
+    # depth-first traversal, where a negative node is the exit from the node
+    stack = [1]
+    while len(stack) > 0:
+        node = stack.pop()
+        if node < 0:
+            union_find.rollback(len(node_edges[-node]))
+            continue
+        if node - size >= time_steps:
+            continue
+        for u, u2 in node_edges[node]:
+            union_find.union(u, u2)
+        stack.append(-node)
+        if node >= size:
+            connected[node - size] = union_find.find(v) == union_find.find(v2)
+        else:
+            stack.append(2 * node + 1)
+            stack.append(2 * node)
+    return connected
+
+
+def load_connectivity(dataset, path):
+    """
+    Adds the connectivity precomputed by datasets/scripts/process_connectivity.py to the dataset as dataset["connected"],
+    if the file at path exists and was computed for the same start and end vertices.
+    """
+    if not os.path.exists(path):
+        return False
+    with open(path, "rb") as fin:
+        connectivity = pickle.load(fin)
+    if connectivity["start_vertex"] != dataset["start_vertex"] or connectivity["end_vertex"] != dataset["end_vertex"]:
+        return False
+    dataset["connected"] = connectivity["connected"]
+    return True
@@ -0,0 +1,45 @@
+"""
+Random number stream owned by a single model.
+"""
+
+import numpy as np
+
+
+class RandomStream(object):
+    """
+    NumPy generator whose uniform floats are drawn in blocks of block_size numbers,
+    and served one at a time through the functions of the random module used by the models (random, randrange, randint, shuffle).
+    Every model owns its stream, so models in the same process do not affect each other's random numbers.
+    """
+
+    def __init__(self, seed, block_size = 4096):
+        self.generator = np.random.default_rng(seed)
+        self.block_size = block_size
+        self.values = []
+
+    def copy(self):
+        """ Returns a stream that continues with the same random numbers as this stream. """
+        stream = RandomStream(None, self.block_size)
+        stream.generator.bit_generator.state = self.generator.bit_generator.state
+        stream.values = list(self.values)
+        return stream
+
+    def random(self):
+        if not self.values:
+            self.values = self.generator.random(self.block_size).tolist()
+        return self.values.pop()
+
+    def randrange(self, stop):
+        if not self.values:
+            self.values = self.generator.random(self.block_size).tolist()
+        value = int(self.values.pop() * stop)
+        return value if value < stop else stop - 1
+
+    def randint(self, a, b):
+        if not self.values:
+            self.values = self.generator.random(self.block_size).tolist()
+        value = int(self.values.pop() * (b - a + 1))
+        return a + value if value <= b - a else b
+
+    def shuffle(self, x):
+        x[:] = [x[i] for i in self.generator.permutation(len(x)).tolist()]
@@ -0,0 +1,57 @@
+"""
+Vertex pool used by the evolving graph model for its active and removed vertices.
+"""
+
+from array import array
+
+
+class VertexPool(object):
+    """
+    Set of vertices from range(n) that supports addition, removal, membership test and uniform random selection in constant time.
+    The pool initially contains all n vertices, or none of them if full is False.
+    Vertices are kept in an array, removal swaps the removed vertex with the last one.
+    position[v] is the index of v in the array, or -1 if v is not in the pool.
+    """
+
+    def __init__(self, n, full = True):
+        if full:
+            self.vertices = array('i', range(n))
+            self.position = array('i', range(n))
+        else:
+            self.vertices = array('i')
+            self.position = array('i', [-1]) * n
+
+    def add(self, v):
+        if self.position[v] != -1:
+            return
+        self.position[v] = len(self.vertices)
+        self.vertices.append(v)
+
+    def remove(self, v):
+        position = self.position[v]
+        if position == -1:
+            raise KeyError(v)
+        last_vertex = self.vertices.pop()
+        if position != len(self.vertices):
+            self.vertices[position] = last_vertex
+            self.position[last_vertex] = position
+        self.position[v] = -1
+
+    def copy(self):
+        pool = VertexPool(0)
+        pool.vertices = array('i', self.vertices)
+        pool.position = array('i', self.position)
+        return pool
+
+    def choose_random(self, rng):
+        """ Returns a uniformly random active vertex, drawn with rng (the random stream of the model). """
+        return self.vertices[rng.randrange(len(self.vertices))]
+
+    def __contains__(self, v):
+        return self.position[v] != -1
+
+    def __len__(self):
+        return len(self.vertices)
+
+    def __iter__(self):
+        return iter(self.vertices)
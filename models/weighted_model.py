@@ -2,8 +2,6 @@
 Was not used in this work.
 """
 
-import random
-
 from models.model import Graph
 
 class WeightedGraph(Graph):
@@ -15,7 +13,7 @@ class WeightedGraph(Graph):
     def construct_random_graph(self):
         self.adjacency_matrix = [[0 for _ in range(self.n)] for _ in range(self.n)]
         edge_weights = [int(i) for i in range(1, self.m + 1)]
-        random.shuffle(edge_weights)
+        self.random.shuffle(edge_weights)
         edge_count = 0
         for v1 in range(self.n):
             for v2 in range(self.n):
@@ -41,7 +39,7 @@ class WeightedGraph(Graph):
         return self.adjacency_matrix[a1][b1] < self.adjacency_matrix[a2][b2]
     
     def change(self):
-        w_lower = random.randint(1, self.m - 1)
+        w_lower = self.random.randint(1, self.m - 1)
         w_higher = w_lower + 1
         e_lower = self.weights_to_edges[w_lower]
         e_higher = self.weights_to_edges[w_higher]
@@ -17,10 +17,11 @@ import argparse
 import os
 import pickle
 
-from models.unweighted_model import UnweightedGraph
-from models.unweighted_model_e import UnweightedGraphE
-from models.unweighted_model_v import UnweightedGraphV
-from models.unweighted_model_ev import UnweightedGraphEV
+from models.adjacency import STORAGE_TYPES
+from models.generation import GENERATION_TYPES
+from models.ground_truth import cached_ground_truth
+from models.offline_connectivity import load_connectivity
+from models.evolving_graph import EvolvingGraph
 from algorithms.algorithm import Algorithm
 from algorithms.one_path import AlgorithmOnePath
 from algorithms.two_path import AlgorithmTwoPath
@@ -35,7 +36,11 @@ def parse_args():
     parser.add_argument('--change', dest = 'change_rate', type = int, default = 1, help = 'Number of changes that graph makes at once (default = 1)')
     parser.add_argument('--probe', dest = 'probe_rate', type = int, default = 1, help = 'Number of probes that the algorithm is allowed to make at once (default = 1)')
     parser.add_argument('--iterations', dest = 'iterations', type = int, default = 10000, help = 'Number of iterations performed')
-    parser.add_argument('--model', dest = 'model', type = str, default = "", help = "Configuration of the model ('e' and 'v' include edge and vertex removals, respectively)")
+    parser.add_argument('--model', dest = 'model', type = str, default = "", help = "Configuration of the model ('e' and 'v' include edge and vertex removals, 'E' and 'V' include edge and vertex insertions, respectively)")
+    parser.add_argument('--storage', dest = 'storage', type = str, default = "set", choices = STORAGE_TYPES, help = "Adjacency storage of the model ('set' (default) for Python sets, 'compact' for array-backed storage with lower memory usage, 'bitset' for a bit matrix with fast searches but slower changes and forks, 'auto' for a bit matrix in small graphs and sets otherwise)")
+    parser.add_argument('--generation', dest = 'generation', type = str, default = "numpy", choices = GENERATION_TYPES, help = "Random graph generation ('numpy' for vectorized generation, 'compat' for the original per-edge generation)")
+    parser.add_argument('--connectivity', dest = 'connectivity', type = int, default = 1, help = 'Validate empty answers with a dynamic connectivity oracle maintained by the model (1, default) or with a breadth-first search (0)')
+    parser.add_argument('--ground_truth', dest = 'ground_truth', type = str, default = "", help = "Directory where the connectivity of every iteration of a random graph is stored once and reused by later experiments with the same model, n, m, change rate, iterations and random seed ('' (default) for no ground truth)")
     parser.add_argument('--dataset', dest = 'dataset', type = str, default = "", help = "Dataset for experiment ('' for a random graph, or 'contact', 'wikipedia')")
     parser.add_argument('--rand_seed', dest = 'rand_seed', type = int, default = 0, help = 'Random seed used for reproducibility (default = 0)')
     parser.add_argument('--visualization', dest = 'visualization_step', type = int, default = -1, help = 'every <visualization_step> iterations, prints a character indicating the validity of answer provided by the algorithm (default = -1 (not active))')
@@ -57,6 +62,7 @@ if "contact" in args.dataset:
     use_dataset = True
     with open(os.path.join("datasets", "contact", "dataset.pkl"), "rb") as fin:
         dataset = pickle.load(fin)
+        load_connectivity(dataset, os.path.join("datasets", "contact", "connectivity.pkl"))
         n = 789
         m = 0
     iterations = len(dataset["edges"])
@@ -66,6 +72,7 @@ elif "wikipedia" in args.dataset:
     print("Loading dataset...")
     with open(os.path.join("datasets", "wikipedia", "dataset.pkl"), "rb") as fin:
         dataset = pickle.load(fin)
+        load_connectivity(dataset, os.path.join("datasets", "wikipedia", "connectivity.pkl"))
         n = 100312
         m = 0
     print("Dataset loaded.")
@@ -83,16 +90,13 @@ elif args.alg.startswith("two"):
 else:
     print("Wrong algorithm name! Use 'one' for one-path algorithm, or 'two' for two-path algorithm.")
 
-if "e" in args.model and "v" in args.model:
-    graph = UnweightedGraphEV(args.rand_seed, n, m, initialize_graph)
-elif "e" in args.model:
-    graph = UnweightedGraphE(args.rand_seed, n, m, initialize_graph)
-elif "v" in args.model:
-    graph = UnweightedGraphV(args.rand_seed, n, m, initialize_graph)
-else:
-    graph = UnweightedGraph(args.rand_seed, n, m, initialize_graph)
+graph = EvolvingGraph(args.rand_seed, n, m, initialize_graph, storage = args.storage, generation = args.generation, model = args.model, connectivity = bool(args.connectivity))
+
+ground_truth = None
+if not use_dataset and args.ground_truth != "":
+    ground_truth = cached_ground_truth(args.ground_truth, graph, args.model, args.rand_seed, args.change_rate, iterations, args.generation)
 
-runner = Runner(args.probe_rate, args.change_rate, algorithm, graph, use_dataset, dataset)
+runner = Runner(args.probe_rate, args.change_rate, algorithm, graph, use_dataset, dataset, ground_truth)
 runner.run(iterations, args.visualization_step)
 
 if not use_dataset:
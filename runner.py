@@ -4,6 +4,7 @@ Performs an experiment by performing interactions between algorithm and the mode
 
 from tqdm import tqdm
 from algorithms.algorithm import Algorithm
+from models.ground_truth import dataset_ground_truth
 
 def visualize_result(algorithm: Algorithm, answer_correct: bool):
     print_char = '.'
@@ -18,7 +19,11 @@ def visualize_result(algorithm: Algorithm, answer_correct: bool):
 
 
 class Runner:
-    def __init__(self, probe_rate, change_rate, algorithm, graph, use_dataset = False, dataset = None):
+    def __init__(self, probe_rate, change_rate, algorithm, graph, use_dataset = False, dataset = None, ground_truth = None):
+        """
+        ground_truth is the list of whether the start and end vertices are connected in every iteration (see models/ground_truth.py),
+        which is used to validate empty answers without a search. For datasets, it defaults to the precomputed connectivity of the dataset.
+        """
         self.correct_answers = 0
         self.correct_answers_after_1st_phase = 0
         self.total_iterations = 0
@@ -37,8 +42,12 @@ class Runner:
             algorithm.set_end_vertex(dataset["end_vertex"])
             graph.set_start_vertex(dataset["start_vertex"])
             graph.set_end_vertex(dataset["end_vertex"])
+            if ground_truth is None and "connected" in dataset:
+                ground_truth = dataset_ground_truth(dataset)
+        self.ground_truth = ground_truth
     
     def run(self, iterations, visualization_step):
+        first_iteration = self.total_iterations
         self.total_iterations += iterations
         for iteration in tqdm(range(iterations), disable = (not self.use_dataset)):
             # perform probes
@@ -48,7 +57,10 @@ class Runner:
 
             # get and validate answers from models
             answer = self.algorithm.answer()
-            answer_correct = (self.graph.validate(answer) == 0)
+            connected = None
+            if self.ground_truth is not None and first_iteration + iteration < len(self.ground_truth):
+                connected = self.ground_truth[first_iteration + iteration]
+            answer_correct = (self.graph.validate(answer, connected) == 0)
             if answer_correct:
                 self.correct_answers += 1
                 if iteration >= self.algorithm.phase_length:
@@ -72,8 +84,7 @@ class Runner:
                 else:
                     self.graph.update_edges(self.dataset["new_edges"][iteration], self.dataset["removed_edges"][iteration])
             else:
-                for j in range(self.change_rate):
-                    self.graph.change()
+                self.graph.change_many(self.change_rate)
         print("correct path: {}".format(self.count_correct_path))
         print("correct empty: {}".format(self.count_correct_empty))
         print("incorrect path: {}".format(self.count_incorrect_path))
@@ -1,10 +1,24 @@
 import copy
+import math
+import os
+import random
+import tempfile
 import unittest
 import sys
 
+import numpy as np
+
 sys.path.append("..")
 
+from models.adjacency import BITSET_MAX_N, BitsetAdjacency, CompactAdjacency
+from models.changes import InsertEdge, InsertVertex, RemoveEdge, RemoveVertex, SwapEdge, create_changes
+from models.edge_pool import EdgePool, EdgePoolOverlay
+from models.evolving_graph import EvolvingGraph
+from models.ground_truth import cached_ground_truth, compute_ground_truth, dataset_ground_truth, ground_truth_name
+from models.offline_connectivity import RollbackUnionFind, edge_lifetimes, offline_connectivity
 from models.unweighted_model import UnweightedGraph
+from models.unweighted_model_e import UnweightedGraphE
+from models.unweighted_model_ev import UnweightedGraphEV
 from models.weighted_model import WeightedGraph
 
 class TestGeneration(unittest.TestCase):
@@ -44,6 +58,47 @@ class TestGeneration(unittest.TestCase):
                 vertices.add(v2)
         self.assertEqual(edge_count / 2, m)
 
+    def test_graph_generation_seeded(self):
+        """
+        Test vectorized generation: the same seed gives the same graph, and every generated edge is stored in both directions.
+        """
+        n = 200
+        m = 2500
+        graph = UnweightedGraph(3, n, m)
+        graph_same_seed = UnweightedGraph(3, n, m, storage = "compact")
+        self.assertListEqual(list(graph.edges), list(graph_same_seed.edges))
+        self.assertEqual(len(set(graph.edges)), m)
+        for edge in graph.edges:
+            self.assertLess(edge[0], edge[1])
+            self.assertTrue(edge[1] in graph_same_seed.adjacency_list[edge[0]])
+            self.assertTrue(edge[0] in graph_same_seed.adjacency_list[edge[1]])
+        for v in range(n):
+            self.assertSetEqual(graph.adjacency_list[v], set(graph_same_seed.adjacency_list[v]))
+
+    def test_graph_generation_compat(self):
+        """
+        Test compat generation: edges should be the same as the ones created by the original per-edge generation loop.
+        """
+        n = 150
+        m = 1507
+        random.seed(5)
+        expected_edges = []
+        adjacency_list = [set() for _ in range(n)]
+        for edge in range(m):
+            non_edge_found = False
+            while not non_edge_found:
+                v = random.randint(0, n - 1)
+                v2 = random.randint(0, n - 1)
+                if v == v2 or v2 in adjacency_list[v]:
+                    continue
+                non_edge_found = True
+                adjacency_list[v].add(v2)
+                adjacency_list[v2].add(v)
+                expected_edges.append((min(v, v2), max(v, v2)))
+        graph = UnweightedGraph(5, n, m, generation = "compat")
+        self.assertListEqual(list(graph.edges), expected_edges)
+        self.assertListEqual(graph.adjacency_list, adjacency_list)
+
     def test_graph_generation_constraints_weighted_ER(self):
         """
         Test ER weighted graph generation:
@@ -204,7 +259,7 @@ class TestChange(unittest.TestCase):
         graph = UnweightedGraph(0, n, 8, False)
         for v in range(n):
             for v2 in adjacency_list[v]:
-                graph.edges.add_item((min(v, v2), max(v, v2)))
+                graph.edges.add(v, v2)
         graph.adjacency_list = adjacency_list
         iterations = 100000
         changes_left = n*n - n
@@ -224,6 +279,74 @@ class TestChange(unittest.TestCase):
                 break
         self.assertEqual(changes_left, 0)
 
+    def test_change_many_unweighted(self):
+        """
+        Tests batched changes of unweighted graph.
+        k batched swaps move at most k edges, and the adjacency list and edge pool stay consistent.
+        """
+        n = 83
+        m = 507
+        graph = UnweightedGraph(0, n, m)
+        for k in [1, 20, 100]:
+            old_adj_list = copy.deepcopy(graph.adjacency_list)
+            graph.change_many(k)
+            self.assertLessEqual(num_changes(old_adj_list, graph.adjacency_list), 2 * k)
+            self.assertGreater(num_changes(old_adj_list, graph.adjacency_list), 0)
+            self.assertEqual(len(graph.edges), m)
+            for v, v2 in graph.edges:
+                self.assertTrue(v2 in graph.adjacency_list[v])
+                self.assertTrue(v in graph.adjacency_list[v2])
+
+    def test_independent_random_streams(self):
+        """
+        Every model draws from its own random stream: interleaved models with the same seed make the same changes,
+        regardless of the global random module.
+        """
+        n = 100
+        m = 700
+        graph = UnweightedGraphEV(4, n, m)
+        random.seed(1)
+        graph_same_seed = UnweightedGraphEV(4, n, m)
+        for i in range(500):
+            graph.change()
+            random.random()
+            graph_same_seed.change()
+        self.assertEqual(graph.m, graph_same_seed.m)
+        self.assertListEqual(list(graph.edges), list(graph_same_seed.edges))
+        self.assertListEqual(graph.adjacency_list, graph_same_seed.adjacency_list)
+
+    def test_change_unweighted_vertex_removal(self):
+        """
+        Tests changes of the model with edge and vertex removals.
+        Removed vertices have no neighbors, and the edge pool, active vertex pool, degree index and adjacency list stay consistent.
+        """
+        n = 100
+        m = 700
+        graph = UnweightedGraphEV(0, n, m)
+        for i in range(3000):
+            graph.change()
+            if i % 100 == 0:
+                removable = 0
+                for v in graph.active_vertices:
+                    degree = len(graph.adjacency_list[v])
+                    if v != graph.start_vertex and v != graph.end_vertex and (graph.n - 1) * (graph.n - 2) / 2 != graph.m - degree and graph.interesting_range_check(m_subtraction = degree, n_subtraction = 1) == 0:
+                        removable += 1
+                self.assertEqual(graph.removable_vertex_count(), removable)
+        self.assertLess(graph.n, n)
+        self.assertEqual(len(graph.active_vertices), graph.n)
+        self.assertEqual(len(graph.edges), graph.m)
+        edge_count = 0
+        for v in range(n):
+            if v not in graph.active_vertices:
+                self.assertEqual(len(graph.adjacency_list[v]), 0)
+            for v2 in graph.adjacency_list[v]:
+                self.assertTrue(v2 in graph.active_vertices)
+                self.assertTrue(graph.edges.contains(v, v2))
+                edge_count += 1
+        self.assertEqual(edge_count / 2, graph.m)
+        self.assertTrue(graph.start_vertex in graph.active_vertices)
+        self.assertTrue(graph.end_vertex in graph.active_vertices)
+
     def test_change_weighted_1(self):
         """
         Tests change of weighted graph.
@@ -269,6 +392,487 @@ class TestChange(unittest.TestCase):
                 break
         self.assertEqual(changes_left, 0)
 
+class TestChangeTypes(unittest.TestCase):
+    def test_small_graph_keeps_non_edge(self):
+        """
+        Edge insertions never make a small graph complete, so edge swaps always find a non-edge.
+        """
+        graph = EvolvingGraph(2, 12, 30, model = "eEvV")
+        for i in range(3000):
+            graph.change()
+            self.assertLess(graph.m, graph.n * (graph.n - 1) // 2)
+
+    def test_complete_graph_swap(self):
+        """
+        A complete graph has no non-edge to swap an edge with, so it does not change.
+        """
+        graph = EvolvingGraph(0, 4, 6)
+        self.assertFalse(SwapEdge().feasible(graph))
+        graph.change()
+        graph.change_many(20)
+        self.assertEqual(sum(len(graph.adjacency_list[v]) for v in range(4)), 12)
+
+    def test_create_changes(self):
+        """
+        Model configuration strings map to change types, edge swap is always included.
+        """
+        self.assertListEqual([type(change) for change in create_changes("basic")], [SwapEdge])
+        self.assertListEqual([type(change) for change in create_changes("")], [SwapEdge])
+        self.assertListEqual([type(change) for change in create_changes("ev")], [SwapEdge, RemoveVertex, RemoveEdge])
+        self.assertListEqual([type(change) for change in create_changes("eEV")], [SwapEdge, RemoveEdge, InsertEdge, InsertVertex])
+        graph = EvolvingGraph(0, 100, 700, model = "v")
+        self.assertIsNotNone(graph.degree_index)
+        graph = EvolvingGraph(0, 100, 700, model = "eE")
+        self.assertIsNone(graph.degree_index)
+
+    def test_change_insertions_and_removals(self):
+        """
+        Tests changes of the model with all change types, given as weighted change types.
+        The interesting range of parameters is retained, and the edge pool, vertex pools, degree index and adjacency list stay consistent.
+        """
+        n = 100
+        m = 700
+        graph = EvolvingGraph(0, n, m, model = [SwapEdge(), RemoveEdge(), RemoveVertex(2), InsertEdge(), InsertVertex(3)])
+        observed = set()
+        for i in range(3000):
+            old_n, old_m = graph.n, graph.m
+            graph.change()
+            observed.add((graph.n - old_n, max(min(graph.m - old_m, 1), -1)))
+            self.assertEqual(graph.interesting_range_check(), 0)
+        # swaps, edge removals, edge insertions, vertex insertions and vertex removals all happened
+        for change in [(0, 0), (0, -1), (0, 1), (1, 0)]:
+            self.assertIn(change, observed)
+        self.assertTrue((-1, 0) in observed or (-1, -1) in observed)
+        self.assertEqual(len(graph.active_vertices) + len(graph.removed_vertices), n)
+        self.assertEqual(len(graph.active_vertices), graph.n)
+        self.assertEqual(len(graph.edges), graph.m)
+        for v in range(n):
+            if v in graph.removed_vertices:
+                self.assertEqual(len(graph.adjacency_list[v]), 0)
+            else:
+                self.assertGreater(graph.degree_index.count(len(graph.adjacency_list[v])), 0)
+            for v2 in graph.adjacency_list[v]:
+                self.assertTrue(v2 in graph.active_vertices)
+                self.assertTrue(graph.edges.contains(v, v2))
+        self.assertEqual(sum(graph.degree_index.count(d) for d in range(n)), graph.n)
+
+class TestEdgePool(unittest.TestCase):
+    def test_edge_pool_operations(self):
+        """
+        Edges are stored once regardless of the endpoint order, and removed edges are never chosen.
+        """
+        n = 10
+        pool = EdgePool(n)
+        pool.add_edges(np.array([0, 5, 2, 7]), np.array([3, 1, 9, 2]))
+        self.assertEqual(len(pool), 4)
+        self.assertFalse(pool.add(3, 0))
+        self.assertTrue(pool.contains(1, 5))
+        self.assertListEqual(list(pool), [(0, 3), (1, 5), (2, 9), (2, 7)])
+        pool.remove(9, 2)
+        pool.remove_edges(np.array([5]), np.array([1]))
+        self.assertListEqual(sorted(pool), [(0, 3), (2, 7)])
+        with self.assertRaises(KeyError):
+            pool.remove(1, 5)
+        for i in range(100):
+            self.assertIn(pool.choose_random(random), [(0, 3), (2, 7)])
+
+    def test_edge_pool_overlay(self):
+        """
+        Random operations on forks of an edge pool should match a set of edges, and leave the shared pool unchanged.
+        """
+        n = 40
+        pool = EdgePool(n)
+        pool.add_edges(np.array([0, 1, 2, 3]), np.array([5, 6, 7, 8]))
+        shared_pool = pool
+        shared = list(pool)
+        pool, fork = pool.fork()
+        rng = random.Random(0)
+        for overlay in [pool, fork]:
+            edges = set(shared)
+            for i in range(5000):
+                v = rng.randint(0, n - 2)
+                v2 = rng.randint(v + 1, n - 1)
+                if rng.random() < 0.2 and len(edges) > 0:
+                    v, v2 = overlay.choose_random(rng)
+                    v3, v4 = rng.randint(0, n - 1), rng.randint(0, n - 1)
+                    if v3 != v4 and not overlay.contains(v3, v4):
+                        overlay.replace(v, v2, v3, v4)
+                        edges.remove((v, v2))
+                        edges.add((min(v3, v4), max(v3, v4)))
+                elif (v, v2) in edges:
+                    overlay.remove(v2, v)
+                    edges.remove((v, v2))
+                else:
+                    self.assertTrue(overlay.add(v, v2))
+                    edges.add((v, v2))
+                self.assertEqual(len(overlay), len(edges))
+            self.assertSetEqual(set(overlay), edges)
+            self.assertEqual(len(list(overlay)), len(edges))
+            overlay, overlay_fork = overlay.fork()
+            self.assertListEqual(list(overlay), list(overlay_fork))
+        self.assertIsInstance(fork, EdgePoolOverlay)
+        self.assertListEqual(list(shared_pool), shared)
+
+class TestFork(unittest.TestCase):
+    def test_fork_same_changes(self):
+        """
+        A fork makes the same changes as its parent and as a model generated with the same seed, without affecting the parent.
+        """
+        n = 120
+        m = 1100
+        for model, storage in [("basic", "set"), ("ev", "set"), ("ev", "compact")]:
+            graph = EvolvingGraph(0, n, m, storage = storage, model = model)
+            graph.change_many(100)
+            fork = graph.fork()
+            fork.change_many(500)
+            fork_edges = sorted(fork.edges)
+            fork_adjacency = [set(fork.adjacency_list[v]) for v in range(n)]
+            graph.change_many(500)
+            fresh_graph = EvolvingGraph(0, n, m, storage = storage, model = model)
+            fresh_graph.change_many(100)
+            fresh_graph.change_many(500)
+            for other in [graph, fresh_graph]:
+                self.assertEqual(other.m, fork.m)
+                self.assertEqual(other.n, fork.n)
+                self.assertListEqual(sorted(other.edges), fork_edges)
+                self.assertListEqual([set(other.adjacency_list[v]) for v in range(n)], fork_adjacency)
+
+    def test_fork_independent(self):
+        """
+        Changes of a fork with a new random seed do not affect the parent, and both stay consistent.
+        """
+        n = 100
+        m = 700
+        graph = EvolvingGraph(0, n, m, model = "evEV")
+        edges = sorted(graph.edges)
+        adjacency_list = [set(neighbors) for neighbors in graph.adjacency_list]
+        fork = graph.fork(rand_seed = 1)
+        fork.change_many(2000)
+        self.assertListEqual(sorted(graph.edges), edges)
+        self.assertListEqual(graph.adjacency_list, adjacency_list)
+        graph.change_many(2000)
+        for model in [graph, fork]:
+            self.assertEqual(len(model.edges), model.m)
+            edge_count = 0
+            for v in range(n):
+                for v2 in model.adjacency_list[v]:
+                    self.assertTrue(model.edges.contains(v, v2))
+                    edge_count += 1
+            self.assertEqual(edge_count, 2 * model.m)
+        self.assertNotEqual(sorted(graph.edges), sorted(fork.edges))
+
+    def test_snapshot_restore(self):
+        """
+        Restoring a snapshot returns the model to the snapshot state, and it repeats the same changes after every restore.
+        """
+        graph = UnweightedGraphEV(0, 100, 700)
+        graph.change_many(300)
+        snapshot = graph.snapshot()
+        edges = sorted(graph.edges)
+        graph.change_many(300)
+        later_edges = sorted(graph.edges)
+        for i in range(3):
+            graph.restore(snapshot)
+            self.assertListEqual(sorted(graph.edges), edges)
+            graph.change_many(300)
+            self.assertListEqual(sorted(graph.edges), later_edges)
+
+class TestCompactStorage(unittest.TestCase):
+    def test_compact_adjacency_operations(self):
+        """
+        Random insertions and removals on the compact storage should give the same neighbors as a list of sets.
+        """
+        n = 50
+        storage = CompactAdjacency(n)
+        adjacency_list = [set() for _ in range(n)]
+        rng = random.Random(0)
+        for i in range(20000):
+            v = rng.randint(0, n - 1)
+            v2 = rng.randint(0, n - 1)
+            if v2 in adjacency_list[v]:
+                adjacency_list[v].remove(v2)
+                storage[v].remove(v2)
+            else:
+                adjacency_list[v].add(v2)
+                storage[v].add(v2)
+            self.assertEqual(v2 in adjacency_list[v], v2 in storage[v])
+        for v in range(n):
+            self.assertEqual(len(adjacency_list[v]), len(storage[v]))
+            self.assertSetEqual(adjacency_list[v], set(storage[v]))
+        storage[3] = []
+        self.assertEqual(len(storage[3]), 0)
+        with self.assertRaises(KeyError):
+            storage[3].remove(4)
+
+    def test_compact_model_equivalence(self):
+        """
+        With the same random seed, compact storage should produce the same graph and changes as the set storage.
+        """
+        n = 120
+        m = 1100
+        graph = UnweightedGraphE(0, n, m)
+        for i in range(300):
+            graph.change()
+        compact_graph = UnweightedGraphE(0, n, m, storage = "compact")
+        for i in range(300):
+            compact_graph.change()
+        self.assertEqual(graph.m, compact_graph.m)
+        for v in range(n):
+            self.assertSetEqual(graph.adjacency_list[v], set(compact_graph.adjacency_list[v]))
+        self.assertEqual(graph.validate([]), compact_graph.validate([]))
+
+class TestBitsetStorage(unittest.TestCase):
+    def test_bitset_adjacency_operations(self):
+        """
+        Random insertions and removals on the bitset storage should give the same neighbors as a list of sets.
+        """
+        n = 50
+        storage = BitsetAdjacency(n)
+        adjacency_list = [set() for _ in range(n)]
+        rng = random.Random(0)
+        for i in range(20000):
+            v = rng.randint(0, n - 1)
+            v2 = rng.randint(0, n - 1)
+            if v2 in adjacency_list[v]:
+                adjacency_list[v].remove(v2)
+                storage[v].remove(v2)
+            else:
+                adjacency_list[v].add(v2)
+                storage[v].add(v2)
+            self.assertEqual(v2 in adjacency_list[v], v2 in storage[v])
+        for v in range(n):
+            self.assertEqual(len(adjacency_list[v]), len(storage[v]))
+            self.assertListEqual(sorted(adjacency_list[v]), list(storage[v]))
+        storage[3] = []
+        self.assertEqual(len(storage[3]), 0)
+        with self.assertRaises(KeyError):
+            storage[3].remove(4)
+
+    def test_bitset_model_equivalence(self):
+        """
+        With the same random seed, bitset storage should produce the same graph, changes and validation results as the set storage.
+        """
+        n = 120
+        m = 700
+        graph = UnweightedGraphEV(0, n, m)
+        bitset_graph = UnweightedGraphEV(0, n, m, storage = "bitset")
+        for i in range(300):
+            graph.change()
+            bitset_graph.change()
+            self.assertEqual(graph.validate([]), bitset_graph.validate([]))
+        self.assertEqual(graph.m, bitset_graph.m)
+        for v in range(n):
+            self.assertSetEqual(graph.adjacency_list[v], set(bitset_graph.adjacency_list[v]))
+        # disconnect the end vertex
+        for v in list(bitset_graph.adjacency_list[n - 1]):
+            bitset_graph.remove_edge(n - 1, v)
+        self.assertEqual(bitset_graph.validate([]), 0)
+        fork = bitset_graph.fork()
+        fork.add_edge(0, n - 1)
+        self.assertEqual(fork.validate([]), 1)
+        self.assertEqual(bitset_graph.validate([]), 0)
+
+    def test_auto_storage(self):
+        """
+        Auto storage uses bitsets up to the size threshold.
+        """
+        self.assertEqual(UnweightedGraph(0, 100, 700, storage = "auto").storage, "bitset")
+        self.assertEqual(UnweightedGraph(0, BITSET_MAX_N + 1, 10 * (BITSET_MAX_N + 1), storage = "auto").storage, "set")
+
+def components(graph):
+    """ Component label of every vertex, computed by breadth-first search. """
+    n = len(graph.adjacency_list)
+    component = [-1] * n
+    for root in range(n):
+        if component[root] == -1:
+            component[root] = root
+            new_vertices = [root]
+            for v in new_vertices:
+                for v2 in graph.adjacency_list[v]:
+                    if component[v2] == -1:
+                        component[v2] = root
+                        new_vertices.append(v2)
+    return component
+
+class TestConnectivity(unittest.TestCase):
+    def assertSameComponents(self, graph):
+        oracle = graph.listeners["connectivity"]
+        component = components(graph)
+        n = len(component)
+        for v in range(n):
+            for v2 in range(v + 1, n):
+                self.assertEqual(oracle.connected(v, v2), component[v] == component[v2])
+        self.assertEqual(oracle.component_count(), len(set(component)))
+
+    def test_connectivity_oracle(self):
+        """
+        Random edge insertions, edge deletions and vertex removals on a sparse graph:
+        the oracle should agree with breadth-first search after every change.
+        """
+        n = 40
+        graph = EvolvingGraph(0, n, 0, False, connectivity = True)
+        rng = random.Random(0)
+        for i in range(1500):
+            v = rng.randint(0, n - 1)
+            v2 = rng.randint(0, n - 1)
+            if v in graph.removed_vertices or v2 in graph.removed_vertices or v == v2:
+                continue
+            if i % 300 == 299 and v not in [graph.start_vertex, graph.end_vertex]:
+                graph.remove_vertex(v)
+            elif v2 in graph.adjacency_list[v]:
+                graph.remove_edge(v, v2)
+            elif len(graph.edges) < 1.2 * n:
+                graph.add_edge(v, v2)
+            if i % 10 == 0:
+                self.assertSameComponents(graph)
+        self.assertSameComponents(graph)
+
+    def test_connectivity_validate(self):
+        """
+        Validation of empty answers with the oracle should agree with the validation by breadth-first search,
+        also in forks and after batched changes.
+        """
+        n = 100
+        m = 470
+        graph = EvolvingGraph(0, n, m, model = "ev", connectivity = True)
+        graph_bfs = EvolvingGraph(0, n, m, model = "ev")
+        for i in range(2000):
+            graph.change()
+            graph_bfs.change()
+            self.assertEqual(graph.validate([]), graph_bfs.validate([]))
+        self.assertSameComponents(graph)
+        fork = graph.fork()
+        fork.change_many(500)
+        self.assertSameComponents(fork)
+        self.assertSameComponents(graph)
+        basic_graph = EvolvingGraph(0, n, m, connectivity = True)
+        basic_graph.change_many(1000)
+        self.assertSameComponents(basic_graph)
+
+    def test_connectivity_replace_edge(self):
+        """
+        The inserted edge of a replacement is not a replacement edge of the removed tree edge.
+        """
+        graph = EvolvingGraph(0, 4, 0, False, connectivity = True)
+        graph.add_edge(0, 1)
+        graph.replace_edge(0, 1, 0, 2)
+        self.assertFalse(graph.listeners["connectivity"].connected(1, 2))
+        self.assertSameComponents(graph)
+
+    def test_connectivity_batched_swaps(self):
+        """
+        Batched edge swaps (which replace edges in place) on a sparse graph with many components.
+        """
+        n = 30
+        graph = EvolvingGraph(0, n, 25, connectivity = True)
+        for i in range(50):
+            graph.change_many(20)
+            self.assertSameComponents(graph)
+
+    def test_connectivity_restore(self):
+        """
+        Restored listeners belong to the restored model.
+        """
+        n = 40
+        graph = EvolvingGraph(1, n, 45, model = "ev", connectivity = True)
+        snapshot = graph.snapshot()
+        graph.change_many(300)
+        graph.restore(snapshot)
+        self.assertIs(graph.listeners["connectivity"].graph, graph)
+        self.assertSameComponents(graph)
+        graph.change_many(300)
+        self.assertSameComponents(graph)
+        graph.import_edges([(0, 1), (1, 2)])
+        self.assertSameComponents(graph)
+
+class TestOfflineConnectivity(unittest.TestCase):
+    def test_rollback_union_find(self):
+        union_find = RollbackUnionFind(5)
+        union_find.union(0, 1)
+        union_find.union(2, 3)
+        union_find.union(1, 0)
+        union_find.union(1, 3)
+        self.assertEqual(union_find.find(0), union_find.find(2))
+        union_find.rollback(2)
+        self.assertNotEqual(union_find.find(0), union_find.find(2))
+        self.assertEqual(union_find.find(0), union_find.find(1))
+        union_find.rollback(2)
+        self.assertEqual(len(set(union_find.find(v) for v in range(5))), 5)
+
+    def test_offline_connectivity_dataset(self):
+        """
+        Offline connectivity of a random dataset timeline should match validation of empty answers on the model,
+        which imports and updates the edges like Runner.
+        """
+        n = 30
+        time_steps = 200
+        rng = random.Random(0)
+        edges = [[]]
+        for i in range(25):
+            v, v2 = rng.randint(0, n - 1), rng.randint(0, n - 1)
+            if (min(v, v2), max(v, v2)) not in edges[0]:
+                edges[0].append((min(v, v2), max(v, v2)))
+        new_edges = [[]]
+        removed_edges = [[]]
+        for t in range(1, time_steps):
+            current = list(edges[t - 1])
+            removed = [edge for edge in current if rng.random() < 0.1]
+            current = [edge for edge in current if edge not in removed]
+            added = []
+            for i in range(rng.randint(0, 4)):
+                v, v2 = rng.randint(0, n - 1), rng.randint(0, n - 1)
+                edge = (min(v, v2), max(v, v2))
+                if edge not in current and edge not in added:
+                    added.append(edge)
+            edges.append(current + added)
+            new_edges.append(added)
+            removed_edges.append(removed)
+        dataset = {"start_vertex": 0, "end_vertex": n - 1, "edges": edges, "new_edges": new_edges, "removed_edges": removed_edges}
+        connected = offline_connectivity(n, time_steps, edge_lifetimes(dataset), 0, n - 1)
+        graph = EvolvingGraph(0, n, 0, False)
+        graph.import_edges(edges[0])
+        for t in range(time_steps):
+            if t > 0:
+                graph.update_edges(new_edges[t], removed_edges[t])
+            self.assertEqual(graph.validate([]), 1 if connected[t] else 0)
+            self.assertEqual(graph.validate([], connected[t]), graph.validate([]))
+        self.assertIn(True, connected)
+        self.assertIn(False, connected)
+
+class TestGroundTruth(unittest.TestCase):
+    def test_compute_ground_truth(self):
+        """
+        Ground truth should match validation of empty answers by breadth-first search on a graph with the same seed,
+        without changing the graph, also with batched changes (change_rate >= 16).
+        """
+        n = 60
+        for model, m, change_rate in [("basic", 300, 20), ("ev", 300, 2), ("eEvV", 70, 2), ("basic", 45, 20)]:
+            graph = EvolvingGraph(4, n, m, model = model)
+            ground_truth = compute_ground_truth(graph, 300, change_rate)
+            self.assertEqual(len(ground_truth), 300)
+            for iteration in range(300):
+                self.assertEqual(graph.validate([]) == 1, ground_truth[iteration])
+                graph.change_many(change_rate)
+            if m < n * math.log(n):
+                self.assertIn(True, ground_truth)
+                self.assertIn(False, ground_truth)
+
+    def test_cached_ground_truth(self):
+        n = 50
+        m = 60
+        with tempfile.TemporaryDirectory() as directory:
+            graph = EvolvingGraph(1, n, m, model = "e")
+            ground_truth = cached_ground_truth(directory, graph, "e", 1, 1, 123)
+            self.assertTrue(os.path.exists(os.path.join(directory, ground_truth_name("e", n, m, 1, 1, 123))))
+            self.assertListEqual(ground_truth, compute_ground_truth(graph, 123, 1))
+            self.assertListEqual(cached_ground_truth(directory, EvolvingGraph(1, n, m, model = "e"), "e", 1, 1, 123), ground_truth)
+            # a stored ground truth is not used for other start and end vertices
+            graph.set_end_vertex(n - 2)
+            self.assertListEqual(cached_ground_truth(directory, graph, "e", 1, 1, 123), compute_ground_truth(graph, 123, 1))
+
+    def test_dataset_ground_truth(self):
+        self.assertListEqual(dataset_ground_truth({"connected": [True, False, True]}), [False, True, False])
+
 class TestValidate(unittest.TestCase):
     def test_validate_unweighted_wrong_structure(self):
         """